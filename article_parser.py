@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Article Page Parsers for F1 News
+Extract title, body text, date and author from a news article page
+"""
+
+from typing import Dict, Optional
+from bs4 import BeautifulSoup
+
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+NO_TITLE = "No title found"
+
+class SoupArticleParser:
+    """Reference extraction on a full BeautifulSoup tree (html.parser); handles any page"""
+    name = 'html.parser'
+
+    def parse(self, html: bytes) -> Dict[str, Optional[str]]:
+        soup = BeautifulSoup(html, 'html.parser')
+
+        # Extract title
+        title_elem = soup.find('h1') or soup.find('title')
+        title = title_elem.get_text().strip() if title_elem else NO_TITLE
+
+        # Extract content
+        content = ""
+        content_elem = soup.find('div', class_='field--name-body') or soup.find('main') or soup.find('article')
+        if content_elem:
+            content = content_elem.get_text().strip()
+        else:
+            # Fallback: get all paragraph text
+            paragraphs = soup.find_all('p')
+            content = ' '.join([p.get_text().strip() for p in paragraphs])
+
+        # Extract date
+        date = None
+        date_elem = soup.find('time') or soup.find('span', class_='date')
+        if date_elem:
+            date = date_elem.get_text().strip()
+
+        # Extract author
+        author = None
+        author_elem = soup.find('span', class_='author') or soup.find('div', class_='author')
+        if author_elem:
+            author = author_elem.get_text().strip()
+
+        return {'title': title, 'content': content, 'date': date, 'author': author}
+
+def has_class(name: str) -> str:
+    """XPath predicate for an element whose class attribute contains the given class token"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+class LxmlArticleParser:
+    """Targeted XPath extraction on an lxml tree, mirroring SoupArticleParser field by field.
+
+    Pages that are not UTF-8, fail to parse, or yield no title go through the
+    fallback parser instead, so results never get worse than the reference.
+    """
+    name = 'lxml'
+
+    # Each field is the first match of the first expression that matches, as with soup.find(a) or soup.find(b)
+    TITLE_XPATHS = ('(//h1)[1]', '(//title)[1]')
+    CONTENT_XPATHS = (f'(//div[{has_class("field--name-body")}])[1]', '(//main)[1]', '(//article)[1]')
+    DATE_XPATHS = ('(//time)[1]', f'(//span[{has_class("date")}])[1]')
+    AUTHOR_XPATHS = (f'(//span[{has_class("author")}])[1]', f'(//div[{has_class("author")}])[1]')
+
+    def __init__(self, fallback: Optional[SoupArticleParser] = None):
+        self.fallback = fallback or SoupArticleParser()
+        self.fallbacks = 0
+
+    @staticmethod
+    def first_text(root, xpaths) -> Optional[str]:
+        for xpath in xpaths:
+            found = root.xpath(xpath)
+            if found:
+                return found[0].text_content().strip()
+        return None
+
+    def parse(self, html: bytes) -> Dict[str, Optional[str]]:
+        try:
+            root = lxml.html.fromstring(html.decode('utf-8'))
+        except (UnicodeDecodeError, ValueError, lxml.etree.ParserError):
+            self.fallbacks += 1
+            return self.fallback.parse(html)
+        # get_text() on the soup tree leaves out script and style text; text_content() would not
+        lxml.etree.strip_elements(root, 'script', 'style', with_tail=False)
+
+        title = self.first_text(root, self.TITLE_XPATHS)
+        if not title:
+            self.fallbacks += 1
+            return self.fallback.parse(html)
+
+        content = self.first_text(root, self.CONTENT_XPATHS)
+        if content is None:
+            # Fallback: get all paragraph text
+            content = ' '.join(p.text_content().strip() for p in root.iter('p'))
+
+        return {
+            'title': title,
+            'content': content,
+            'date': self.first_text(root, self.DATE_XPATHS),
+            'author': self.first_text(root, self.AUTHOR_XPATHS)
+        }
+
+PARSERS = ('auto', LxmlArticleParser.name, SoupArticleParser.name)
+
+def get_article_parser(name: str = 'auto'):
+    """Parser by name; 'auto' uses lxml when it is installed"""
+    if name == 'auto':
+        name = LxmlArticleParser.name if lxml is not None else SoupArticleParser.name
+    if name == LxmlArticleParser.name:
+        if lxml is None:
+            raise ValueError("The lxml parser requires the lxml package")
+        return LxmlArticleParser()
+    if name == SoupArticleParser.name:
+        return SoupArticleParser()
+    raise ValueError(f"Unknown article parser: {name}")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: BeautifulSoup (html.parser) vs lxml/XPath article extraction
+Runs over saved USCIS article pages: *.html files in a directory, or the bodies
+in the scraper's HTTP cache (.http_cache). Falls back to a synthetic page.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from article_parser import LxmlArticleParser, SoupArticleParser
+
+SYNTHETIC_PAGE = """<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>USCIS Newsroom</title>
+<script>window.dataLayer = window.dataLayer || [];</script></head>
+<body><header><nav>{nav}</nav></header>
+<main><h1>USCIS Updates Guidance on OPT for F-1 Students</h1>
+<div class="news-meta"><time datetime="2025-09-18T12:00:00Z">September 18, 2025</time>
+<span class="author">USCIS Office of Public Affairs</span></div>
+<div class="field field--name-body field--type-text-with-summary">{body}
+<script>window.dataLayer.push({{'event': 'article_view'}});</script><style>.a{{}}</style></div></main>
+<footer>{footer}</footer></body></html>
+"""
+
+def synthetic_pages():
+    nav = ''.join(f'<a href="/section-{i}">Section {i}</a>' for i in range(150))
+    body = ''.join(f'<p>Paragraph {i}: F-1 students on optional practical training must report '
+                   f'changes to their DSO within 10 days.</p>' for i in range(40))
+    footer = ''.join(f'<a href="/footer-{i}">Footer link {i}</a>' for i in range(80))
+    return [SYNTHETIC_PAGE.format(nav=nav, body=body, footer=footer).encode('utf-8')]
+
+def load_pages(source: str):
+    """Saved article pages from a directory of .html files or an HTTP cache directory"""
+    paths = sorted(glob.glob(os.path.join(source, '*.html')))
+    index_file = os.path.join(source, 'index.json')
+    if not paths and os.path.exists(index_file):
+        # HTTP cache bodies are stored under the sha256 of their URL
+        with open(index_file, 'r', encoding='utf-8') as f:
+            urls = [entry['url'] for entry in json.load(f) if '/newsroom/' in entry['url']]
+        paths = [os.path.join(source, hashlib.sha256(url.encode('utf-8')).hexdigest()) for url in urls]
+    pages = []
+    for path in paths:
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                pages.append(f.read())
+    return pages
+
+def bench(parser, pages, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for page in pages:
+            parser.parse(page)
+    return (time.perf_counter() - start) / (repeat * len(pages))
+
+def main():
+    source = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '.http_cache')
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    pages = load_pages(source) if os.path.isdir(source) else []
+    label = source
+    if not pages:
+        pages = synthetic_pages()
+        label = 'synthetic page'
+
+    soup_parser = SoupArticleParser()
+    lxml_parser = LxmlArticleParser()
+    mismatches = sum(soup_parser.parse(page) != lxml_parser.parse(page) for page in pages)
+    lxml_parser.fallbacks = 0
+
+    soup_time = bench(soup_parser, pages, repeat)
+    lxml_time = bench(lxml_parser, pages, repeat)
+
+    print(f"Pages: {len(pages)} from {label} (avg {sum(map(len, pages)) // len(pages)} bytes), repeat {repeat}")
+    print(f"BeautifulSoup html.parser: {soup_time * 1e3:8.2f} ms/article")
+    print(f"lxml + XPath:              {lxml_time * 1e3:8.2f} ms/article")
+    print(f"Speedup:                   {soup_time / lxml_time:8.1f}x")
+    print(f"Fields differing: {mismatches}/{len(pages)} pages, lxml fallbacks: {lxml_parser.fallbacks // repeat}")
+
+if __name__ == "__main__":
+    main()
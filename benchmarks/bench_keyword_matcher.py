@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: per-keyword substring scans vs the single-pass KeywordMatcher
+Runs over the article text in the f1_news_*.json / .jsonl snapshots
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from f1_news_scraper import USCISF1NewsScraper
+from search_interface import is_snapshot_file, iter_articles
+
+def load_corpus(data_dir: str):
+    """Collect title + content of every article in the snapshot files (by-country files repeat them)"""
+    texts = []
+    for filename in sorted(os.listdir(data_dir)):
+        if is_snapshot_file(filename):
+            articles = iter_articles(os.path.join(data_dir, filename))
+            texts.extend(f"{a.get('title', '')} {a.get('content', '')}" for a in articles)
+    return texts
+
+def legacy_classify(scraper, text: str):
+    """The original is_f1_related + extract_countries scans"""
+    text_lower = text.lower()
+    is_f1 = any(keyword in text_lower for keyword in scraper.f1_keywords)
+    countries = list(set(c.title() for c in scraper.country_keywords if c in text_lower))
+    return is_f1, countries
+
+def compare(scraper, texts):
+    """Count articles whose classification differs from the legacy substring scans"""
+    diffs = {'f1 gained': 0, 'f1 lost': 0, 'countries gained': 0, 'countries lost': 0}
+    for text in texts:
+        legacy_f1, legacy_countries = legacy_classify(scraper, text)
+        current = scraper.classify(text)
+        diffs['f1 gained'] += current['is_f1_related'] and not legacy_f1
+        diffs['f1 lost'] += legacy_f1 and not current['is_f1_related']
+        diffs['countries gained'] += len(set(current['countries']) - set(legacy_countries))
+        diffs['countries lost'] += len(set(legacy_countries) - set(current['countries']))
+    return diffs
+
+def bench(fn, texts, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            fn(text)
+    return (time.perf_counter() - start) / (repeat * len(texts))
+
+def main():
+    data_dir = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    
+    # No API calls are made and nothing is written to disk
+    scraper = USCISF1NewsScraper('benchmark', cache_dir=None, summary_cache_path=None)
+    texts = load_corpus(data_dir)
+    if not texts:
+        print("No articles found in f1_news_*.json or .jsonl")
+        return
+    
+    legacy = bench(lambda t: legacy_classify(scraper, t), texts, repeat)
+    single_pass = bench(scraper.classify, texts, repeat)
+    
+    print(f"Articles: {len(texts)} (avg {sum(map(len, texts)) // len(texts)} chars), repeat {repeat}")
+    print(f"Substring scans:  {legacy * 1e6:8.1f} us/article")
+    print(f"KeywordMatcher:   {single_pass * 1e6:8.1f} us/article")
+    print(f"Speedup:          {legacy / single_pass:8.1f}x")
+    # Differences are expected: substring scans also hit inside words ('opt' in 'option')
+    diffs = compare(scraper, texts)
+    print("Versus substring scans: " + ", ".join(f"{label} {count}" for label, count in diffs.items()))
+
+if __name__ == "__main__":
+    main()
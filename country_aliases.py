@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Country Aliases for F1 News
+Resolves user input (names, ISO codes, demonyms, common variants and typos) to
+the country names stored in the news data
+"""
+
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set
+
+# Canonical name (as the scraper stores it, i.e. title-cased) -> aliases.
+# Aliases cover ISO 3166 alpha-2/alpha-3 codes, demonyms and common variants.
+COUNTRY_ALIASES = {
+    'China': ['cn', 'chn', 'chinese', 'prc', "people's republic of china", 'mainland china'],
+    'India': ['in', 'ind', 'indian', 'republic of india', 'bharat'],
+    'South Korea': ['kr', 'kor', 'korea', 'korean', 'south korean', 'republic of korea', 'korea, republic of', 'rok'],
+    'Canada': ['ca', 'can', 'canadian'],
+    'Brazil': ['br', 'bra', 'brazilian', 'brasil'],
+    'Mexico': ['mx', 'mex', 'mexican'],
+    'Japan': ['jp', 'jpn', 'japanese'],
+    'Taiwan': ['tw', 'twn', 'taiwanese', 'republic of china', 'roc', 'chinese taipei'],
+    'Thailand': ['th', 'tha', 'thai'],
+    'Vietnam': ['vn', 'vnm', 'vietnamese', 'viet nam'],
+    'Philippines': ['ph', 'phl', 'filipino', 'philippine', 'the philippines'],
+    'Indonesia': ['id', 'idn', 'indonesian'],
+    'Malaysia': ['my', 'mys', 'malaysian'],
+    'Singapore': ['sg', 'sgp', 'singaporean'],
+    'Hong Kong': ['hk', 'hkg', 'hongkonger', 'hong konger'],
+    'Saudi Arabia': ['sa', 'sau', 'saudi', 'saudi arabian', 'ksa'],
+    'Turkey': ['tr', 'tur', 'turkish', 'turkiye'],
+    'Iran': ['ir', 'irn', 'iranian', 'persia', 'persian', 'iran, islamic republic of', 'islamic republic of iran'],
+    'Iraq': ['iq', 'irq', 'iraqi'],
+    'Afghanistan': ['af', 'afg', 'afghan'],
+    'Bangladesh': ['bd', 'bgd', 'bangladeshi'],
+    'Pakistan': ['pk', 'pak', 'pakistani'],
+    'Nepal': ['np', 'npl', 'nepali', 'nepalese'],
+    'Sri Lanka': ['lk', 'lka', 'sri lankan'],
+    'Myanmar': ['mm', 'mmr', 'burma', 'burmese'],
+    'Laos': ['la', 'lao', 'laotian', 'lao pdr'],
+    'Cambodia': ['kh', 'khm', 'cambodian'],
+    'Mongolia': ['mn', 'mng', 'mongolian'],
+    'Uzbekistan': ['uz', 'uzb', 'uzbek'],
+    'Kazakhstan': ['kz', 'kaz', 'kazakh', 'kazakhstani'],
+    'Kyrgyzstan': ['kg', 'kgz', 'kyrgyz'],
+    'Tajikistan': ['tj', 'tjk', 'tajik'],
+    'Turkmenistan': ['tm', 'tkm', 'turkmen'],
+    'Azerbaijan': ['az', 'aze', 'azerbaijani'],
+    'Armenia': ['am', 'arm', 'armenian'],
+    'Georgia': ['ge', 'geo', 'georgian'],
+    'Russia': ['ru', 'rus', 'russian', 'russian federation'],
+    'Ukraine': ['ua', 'ukr', 'ukrainian'],
+    'Belarus': ['by', 'blr', 'belarusian'],
+    'Moldova': ['md', 'mda', 'moldovan'],
+    'Romania': ['ro', 'rou', 'romanian'],
+    'Bulgaria': ['bg', 'bgr', 'bulgarian'],
+    'Serbia': ['rs', 'srb', 'serbian'],
+    'Croatia': ['hr', 'hrv', 'croatian'],
+    'Slovenia': ['si', 'svn', 'slovenian'],
+    'Slovakia': ['sk', 'svk', 'slovak'],
+    'Czech Republic': ['cz', 'cze', 'czech', 'czechia'],
+    'Hungary': ['hu', 'hun', 'hungarian'],
+    'Poland': ['pl', 'pol', 'polish'],
+    'Lithuania': ['lt', 'ltu', 'lithuanian'],
+    'Latvia': ['lv', 'lva', 'latvian'],
+    'Estonia': ['ee', 'est', 'estonian'],
+    'Finland': ['fi', 'fin', 'finnish'],
+    'Sweden': ['se', 'swe', 'swedish'],
+    'Norway': ['no', 'nor', 'norwegian'],
+    'Denmark': ['dk', 'dnk', 'danish'],
+    'Germany': ['de', 'deu', 'german', 'deutschland'],
+    'Austria': ['at', 'aut', 'austrian'],
+    'Switzerland': ['ch', 'che', 'swiss'],
+    'Liechtenstein': ['li', 'lie'],
+    'Netherlands': ['nl', 'nld', 'dutch', 'holland', 'the netherlands'],
+    'Belgium': ['be', 'bel', 'belgian'],
+    'Luxembourg': ['lu', 'lux'],
+    'France': ['fr', 'fra', 'french'],
+    'Monaco': ['mc', 'mco', 'monegasque'],
+    'Spain': ['es', 'esp', 'spanish'],
+    'Portugal': ['pt', 'prt', 'portuguese'],
+    'Italy': ['it', 'ita', 'italian'],
+    'Vatican': ['va', 'vat', 'vatican city', 'holy see'],
+    'San Marino': ['sm', 'smr'],
+    'Malta': ['mt', 'mlt', 'maltese'],
+    'Cyprus': ['cy', 'cyp', 'cypriot'],
+    'Greece': ['gr', 'grc', 'greek'],
+    'Albania': ['al', 'alb', 'albanian'],
+    'Macedonia': ['mk', 'mkd', 'macedonian', 'north macedonia'],
+    'Montenegro': ['me', 'mne'],
+    'Bosnia': ['ba', 'bih', 'bosnian', 'bosnia and herzegovina', 'herzegovina'],
+    'Kosovo': ['xk', 'xkx', 'kosovar'],
+    'Ireland': ['ie', 'irl', 'irish'],
+    'United Kingdom': ['uk', 'gb', 'gbr', 'british', 'britain', 'great britain', 'england', 'scotland', 'wales'],
+    'Lebanon': ['lb', 'lbn', 'lebanese'],
+    'Syria': ['sy', 'syr', 'syrian'],
+    'Jordan': ['jo', 'jor', 'jordanian'],
+    'Israel': ['il', 'isr', 'israeli'],
+    'Palestine': ['ps', 'pse', 'palestinian'],
+    'Egypt': ['eg', 'egy', 'egyptian'],
+    'Libya': ['ly', 'lby', 'libyan'],
+    'Tunisia': ['tn', 'tun', 'tunisian'],
+    'Algeria': ['dz', 'dza', 'algerian'],
+    'Morocco': ['ma', 'mar', 'moroccan'],
+    'Sudan': ['sd', 'sdn', 'sudanese'],
+    'South Sudan': ['ss', 'ssd', 'south sudanese'],
+    'Ethiopia': ['et', 'eth', 'ethiopian'],
+    'Eritrea': ['er', 'eri', 'eritrean'],
+    'Djibouti': ['dj', 'dji', 'djiboutian'],
+    'Somalia': ['so', 'som', 'somali'],
+    'Kenya': ['ke', 'ken', 'kenyan'],
+    'Uganda': ['ug', 'uga', 'ugandan'],
+    'Tanzania': ['tz', 'tza', 'tanzanian'],
+    'Rwanda': ['rw', 'rwa', 'rwandan'],
+    'Burundi': ['bi', 'bdi', 'burundian'],
+    'Madagascar': ['mg', 'mdg', 'malagasy'],
+    'Mauritius': ['mu', 'mus', 'mauritian'],
+    'Seychelles': ['sc', 'syc', 'seychellois'],
+    'Comoros': ['km', 'com', 'comorian'],
+    'Malawi': ['mw', 'mwi', 'malawian'],
+    'Zambia': ['zm', 'zmb', 'zambian'],
+    'Zimbabwe': ['zw', 'zwe', 'zimbabwean'],
+    'Botswana': ['bw', 'bwa', 'motswana', 'batswana'],
+    'Namibia': ['na', 'nam', 'namibian'],
+    'South Africa': ['za', 'zaf', 'south african'],
+    'Lesotho': ['ls', 'lso'],
+    'Swaziland': ['sz', 'swz', 'eswatini', 'swazi'],
+    'Mozambique': ['mz', 'moz', 'mozambican'],
+    'Angola': ['ao', 'ago', 'angolan'],
+    'Congo': ['cg', 'cog', 'cd', 'cod', 'congolese', 'republic of the congo',
+              'democratic republic of the congo', 'drc'],
+    'Central African Republic': ['cf', 'caf', 'car'],
+    'Cameroon': ['cm', 'cmr', 'cameroonian'],
+    'Chad': ['td', 'tcd', 'chadian'],
+    'Niger': ['ne', 'ner', 'nigerien'],
+    'Nigeria': ['ng', 'nga', 'nigerian'],
+    'Benin': ['bj', 'ben', 'beninese'],
+    'Togo': ['tg', 'tgo', 'togolese'],
+    'Ghana': ['gh', 'gha', 'ghanaian'],
+    'Burkina Faso': ['bf', 'bfa', 'burkinabe'],
+    'Mali': ['ml', 'mli', 'malian'],
+    'Senegal': ['sn', 'sen', 'senegalese'],
+    'Gambia': ['gm', 'gmb', 'gambian', 'the gambia'],
+    'Guinea-Bissau': ['gw', 'gnb', 'bissau-guinean'],
+    'Guinea': ['gn', 'gin', 'guinean'],
+    'Sierra Leone': ['sl', 'sle', 'sierra leonean'],
+    'Liberia': ['lr', 'lbr', 'liberian'],
+    'Ivory Coast': ['ci', 'civ', 'ivorian', "cote d'ivoire"],
+    'Gabon': ['ga', 'gab', 'gabonese'],
+    'Equatorial Guinea': ['gq', 'gnq', 'equatoguinean'],
+    'Sao Tome And Principe': ['st', 'stp'],
+    'Cape Verde': ['cv', 'cpv', 'cabo verde', 'cape verdean'],
+    'Argentina': ['ar', 'arg', 'argentine', 'argentinian'],
+    'Bolivia': ['bo', 'bol', 'bolivian'],
+    'Chile': ['cl', 'chl', 'chilean'],
+    'Colombia': ['co', 'col', 'colombian'],
+    'Ecuador': ['ec', 'ecu', 'ecuadorian'],
+    'Guyana': ['gy', 'guy', 'guyanese'],
+    'Paraguay': ['py', 'pry', 'paraguayan'],
+    'Peru': ['pe', 'per', 'peruvian'],
+    'Suriname': ['sr', 'sur', 'surinamese'],
+    'Uruguay': ['uy', 'ury', 'uruguayan'],
+    'Venezuela': ['ve', 'ven', 'venezuelan'],
+    'Australia': ['au', 'aus', 'australian'],
+    'New Zealand': ['nz', 'nzl', 'new zealander', 'kiwi'],
+    'Fiji': ['fj', 'fji', 'fijian'],
+    'Papua New Guinea': ['pg', 'png', 'papua new guinean'],
+    'Solomon Islands': ['sb', 'slb'],
+    'Vanuatu': ['vu', 'vut'],
+    'Samoa': ['ws', 'wsm', 'samoan'],
+    'Tonga': ['to', 'ton', 'tongan'],
+    'Kiribati': ['ki', 'kir'],
+    'Tuvalu': ['tv', 'tuv'],
+    'Nauru': ['nr', 'nru'],
+    'Palau': ['pw', 'plw'],
+    'Marshall Islands': ['mh', 'mhl'],
+    'Micronesia': ['fm', 'fsm', 'micronesian'],
+}
+
+def normalize(name: str) -> str:
+    """Casefold, strip accents and punctuation, collapse whitespace"""
+    name = unicodedata.normalize('NFKD', name)
+    name = ''.join(char for char in name if not unicodedata.combining(char))
+    return ' '.join(re.sub(r"[^\w]+", ' ', name.casefold()).split())
+
+def trigrams(name: str) -> Set[str]:
+    padded = f"  {name} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+# Normalized alias -> canonical name, built once at import
+ALIAS_TABLE = {}
+for _canonical, _aliases in COUNTRY_ALIASES.items():
+    for _alias in [_canonical] + _aliases:
+        ALIAS_TABLE[normalize(_alias)] = _canonical
+
+class CountryResolver:
+    """Constant-time country lookup over the names present in the data.
+
+    Names, ISO codes, demonyms and variants are resolved with one dict lookup. Only
+    when that misses is a trigram candidate search used to correct typos.
+    """
+    # Aliases shorter than this (ISO codes) are too short for fuzzy matching
+    FUZZY_MIN_LENGTH = 4
+    FUZZY_CANDIDATES = 20
+
+    def __init__(self, country_names: Iterable[str]):
+        # Normalized alias -> canonical name, extended with data names not in the table
+        self.aliases = dict(ALIAS_TABLE)
+        # Canonical name -> country names as they appear in the data
+        self.data_names: Dict[str, List[str]] = {}
+        for name in country_names:
+            canonical = self.aliases.setdefault(normalize(name), name)
+            self.data_names.setdefault(canonical, []).append(name)
+
+        # Trigram -> aliases containing it, for the fuzzy fallback
+        self.trigram_index: Dict[str, Set[str]] = {}
+        for alias in self.aliases:
+            if len(alias) >= self.FUZZY_MIN_LENGTH:
+                for gram in trigrams(alias):
+                    self.trigram_index.setdefault(gram, set()).add(alias)
+
+    def canonical(self, query: str, fuzzy: bool = True) -> Optional[str]:
+        """Canonical country name for a query, or None if nothing matches"""
+        key = normalize(query)
+        canonical = self.aliases.get(key)
+        if canonical is None and fuzzy and len(key) >= self.FUZZY_MIN_LENGTH:
+            alias = self.fuzzy_match(key)
+            canonical = self.aliases[alias] if alias else None
+        return canonical
+
+    def resolve(self, query: str, fuzzy: bool = True) -> List[str]:
+        """Country names in the data that a query refers to"""
+        canonical = self.canonical(query, fuzzy)
+        return list(self.data_names.get(canonical, [])) if canonical else []
+
+    def fuzzy_match(self, key: str) -> Optional[str]:
+        """Closest alias to a misspelled key.
+
+        Trigram overlap picks a handful of candidates, which are then ranked by
+        edit distance (transpositions count once) and trigram similarity.
+        """
+        query_grams = trigrams(key)
+        shared = {}
+        for gram in query_grams:
+            for alias in self.trigram_index.get(gram, ()):
+                shared[alias] = shared.get(alias, 0) + 1
+
+        candidates = sorted(shared, key=lambda alias: -shared[alias])[:self.FUZZY_CANDIDATES]
+        max_distance = max(1, len(key) // 3)
+        best, best_rank = None, None
+        for alias in candidates:
+            distance = edit_distance(key, alias)
+            if distance > max_distance:
+                continue
+            similarity = shared[alias] / (len(query_grams) + len(trigrams(alias)) - shared[alias])
+            rank = (distance, -similarity, alias)
+            if best_rank is None or rank < best_rank:
+                best, best_rank = alias, rank
+        return best
+
+def edit_distance(a: str, b: str) -> int:
+    """Optimal string alignment distance (Levenshtein plus adjacent transpositions)"""
+    previous2, previous = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        previous2, previous = previous, current
+    return previous[-1]
@@ -8,24 +8,636 @@ import requests
 from bs4 import BeautifulSoup
 import json
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta
 import re
 import os
+import argparse
+import threading
+import hashlib
+import io
+import queue
+import sqlite3
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urljoin, urlparse, urlsplit, urlunsplit
+from xml.etree import ElementTree
 from openai import OpenAI
-from typing import List, Dict, Any
+from article_parser import get_article_parser, PARSERS
+from country_aliases import COUNTRY_ALIASES, CountryResolver
+from news_article import Article, json_default
+from news_dates import DateNormalizer, date_normalizer
+from typing import List, Dict, Any, Optional, Tuple
 import time
+import random
+
+def check_rate(rate: float, capacity: float):
+    """Reject rate limits that would divide by zero or never grant a token"""
+    if rate <= 0:
+        raise ValueError(f"Request rate must be positive, got {rate}")
+    if capacity < 1:
+        raise ValueError(f"Burst size must be at least 1, got {capacity}")
+
+class TokenBucket:
+    """Token bucket allowing `rate` requests per second with bursts up to `capacity`"""
+    def __init__(self, rate: float, capacity: float = 1.0):
+        check_rate(rate, capacity)
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+class HostRateLimiter:
+    """Keeps one token bucket per host so every site gets the same politeness budget"""
+    def __init__(self, rate: float, capacity: float = 1.0):
+        # Buckets are created lazily in fetch threads, so bad settings are rejected here
+        check_rate(rate, capacity)
+        self.rate = rate
+        self.capacity = capacity
+        self.buckets = {}
+        self.lock = threading.Lock()
+    
+    def acquire(self, url: str):
+        """Wait for the bucket of the URL's host"""
+        host = urlparse(url).netloc
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.capacity)
+                self.buckets[host] = bucket
+        bucket.acquire()
+
+# Saved by-country databases: one article table plus country -> article ids
+COUNTRY_DB_FORMAT = 'f1_news_by_country'
+
+# Dates printed next to links on listing pages ("September 18, 2025", "09/18/2025", "2025-09-18")
+LISTING_DATE_RE = re.compile(r'\b(?:[A-Z][a-z]+ \d{1,2}, \d{4}|\d{1,2}/\d{1,2}/\d{4}|\d{4}-\d{2}-\d{2})\b')
+
+# Entry elements of sitemaps (<url>, <sitemap>), RSS (<item>) and Atom (<entry>)
+FEED_ENTRY_TAGS = ('url', 'sitemap', 'item', 'entry')
+
+class HTTPCache:
+    """Persistent on-disk cache of response bodies and their validators, evicted LRU by size"""
+    def __init__(self, cache_dir: str = '.http_cache', max_bytes: int = 100 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.index_file = os.path.join(cache_dir, 'index.json')
+        self.entries = OrderedDict()  # url -> validators, least recently used first
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+        
+        os.makedirs(cache_dir, exist_ok=True)
+        self.load()
+    
+    def load(self):
+        """Load the cache index from disk"""
+        if not os.path.exists(self.index_file):
+            return
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                for entry in json.load(f):
+                    if os.path.exists(self._body_path(entry['url'])):
+                        self.entries[entry['url']] = entry
+                        self.total_bytes += entry['size']
+        except Exception as e:
+            print(f"Error loading HTTP cache index: {str(e)}")
+    
+    def save(self):
+        """Write the cache index to disk, preserving LRU order"""
+        with self.lock:
+            entries = list(self.entries.values())
+        tmp_file = self.index_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(entries, f)
+        os.replace(tmp_file, self.index_file)
+    
+    def _body_path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha256(url.encode('utf-8')).hexdigest())
+    
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the validators for a cached URL and mark it recently used"""
+        with self.lock:
+            entry = self.entries.get(url)
+            if entry:
+                self.entries.move_to_end(url)
+            return entry
+    
+    def read_body(self, url: str) -> Optional[bytes]:
+        """Read a cached body, or None if it is missing on disk"""
+        try:
+            with open(self._body_path(url), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def store(self, url: str, response: requests.Response) -> Optional[Dict[str, Any]]:
+        """Cache a response body if it carries ETag or Last-Modified validators"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        body = response.content
+        if not (etag or last_modified) or len(body) > self.max_bytes:
+            return None
+        
+        entry = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'sha256': hashlib.sha256(body).hexdigest(),
+            'size': len(body)
+        }
+        with open(self._body_path(url), 'wb') as f:
+            f.write(body)
+        
+        with self.lock:
+            old = self.entries.pop(url, None)
+            if old:
+                self.total_bytes -= old['size']
+            self.entries[url] = entry
+            self.total_bytes += entry['size']
+            
+            # Evict least recently used bodies until we fit the size bound
+            while self.total_bytes > self.max_bytes:
+                evicted_url, evicted = self.entries.popitem(last=False)
+                self.total_bytes -= evicted['size']
+                self.evictions += 1
+                try:
+                    os.remove(self._body_path(evicted_url))
+                except OSError:
+                    pass
+        return entry
+    
+    def record(self, hit: bool):
+        """Count a cache hit or miss"""
+        with self.lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size"""
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': len(self.entries),
+                'bytes': self.total_bytes
+            }
+
+class CachedSession(requests.Session):
+    """requests.Session that revalidates GETs against an HTTPCache and reuses bodies on 304"""
+    def __init__(self, cache: HTTPCache):
+        super().__init__()
+        self.cache = cache
+    
+    def request(self, method, url, *args, **kwargs):
+        if method.upper() != 'GET':
+            return super().request(method, url, *args, **kwargs)
+        
+        headers = dict(kwargs.pop('headers', None) or {})
+        entry = self.cache.get(url)
+        conditional_headers = dict(headers)
+        if entry:
+            if entry.get('etag'):
+                conditional_headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                conditional_headers['If-Modified-Since'] = entry['last_modified']
+        
+        response = super().request(method, url, *args, headers=conditional_headers, **kwargs)
+        
+        if response.status_code == 304 and entry:
+            body = self.cache.read_body(url)
+            if body is not None:
+                response.status_code = 200
+                response._content = body
+                response.from_cache = True
+                response.body_hash = entry['sha256']
+                self.cache.record(hit=True)
+                return response
+            # Body vanished from disk, fetch it again unconditionally
+            response = super().request(method, url, *args, headers=headers, **kwargs)
+        
+        self.cache.record(hit=False)
+        response.from_cache = False
+        response.body_hash = None
+        if response.status_code == 200:
+            stored = self.cache.store(url, response)
+            if stored:
+                response.body_hash = stored['sha256']
+        return response
+    
+    def close(self):
+        self.cache.save()
+        super().close()
+
+class SeenURLStore:
+    """SQLite record of article URLs already crawled, with content hash, date and processing state"""
+    # States that need no more work unless the page content changes. 'out_of_window'
+    # is not one of them: the window is set per run, so it is rechecked every time
+    DONE_STATES = ('not_f1', 'processed')
+    
+    def __init__(self, db_path: str = 'seen_urls.db'):
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS seen_urls (
+                url TEXT PRIMARY KEY,
+                content_hash TEXT,
+                parsed_date TEXT,
+                state TEXT NOT NULL,
+                first_seen TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+        ''')
+        self.conn.commit()
+    
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the stored record for a URL"""
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT url, content_hash, parsed_date, state, first_seen, updated_at FROM seen_urls WHERE url = ?',
+                (url,)
+            ).fetchone()
+        if not row:
+            return None
+        return dict(zip(('url', 'content_hash', 'parsed_date', 'state', 'first_seen', 'updated_at'), row))
+    
+    def is_done(self, url: str, content_hash: Optional[str] = None) -> bool:
+        """True if the URL was fully processed (and, when given, its content hash is unchanged)"""
+        record = self.get(url)
+        if not record or record['state'] not in self.DONE_STATES:
+            return False
+        return content_hash is None or record['content_hash'] == content_hash
+    
+    def record(self, url: str, content_hash: Optional[str], parsed_date: Optional[str], state: str):
+        """Insert or update a URL after it has been fetched"""
+        now = datetime.now().isoformat()
+        with self.lock:
+            self.conn.execute('''
+                INSERT INTO seen_urls (url, content_hash, parsed_date, state, first_seen, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    content_hash = excluded.content_hash,
+                    parsed_date = excluded.parsed_date,
+                    state = excluded.state,
+                    updated_at = excluded.updated_at
+            ''', (url, content_hash, parsed_date, state, now, now))
+            self.conn.commit()
+    
+    def set_state(self, url: str, state: str):
+        """Update the processing state of a URL"""
+        with self.lock:
+            self.conn.execute(
+                'UPDATE seen_urls SET state = ?, updated_at = ? WHERE url = ?',
+                (state, datetime.now().isoformat(), url)
+            )
+            self.conn.commit()
+    
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+class SummaryCache:
+    """SQLite store of article summaries keyed by content hash, model and prompt version"""
+    def __init__(self, db_path: str = 'summaries.db'):
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS summaries (
+                cache_key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                prompt_version TEXT NOT NULL,
+                summary TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            )
+        ''')
+        self.conn.commit()
+    
+    @staticmethod
+    def make_key(content: str, model: str, prompt_version: str) -> str:
+        """Hash of the content together with everything that changes the summary"""
+        return hashlib.sha256(f"{model}\0{prompt_version}\0{content}".encode('utf-8')).hexdigest()
+    
+    def get(self, cache_key: str) -> Optional[str]:
+        with self.lock:
+            row = self.conn.execute('SELECT summary FROM summaries WHERE cache_key = ?', (cache_key,)).fetchone()
+        return row[0] if row else None
+    
+    def put(self, cache_key: str, model: str, prompt_version: str, summary: str):
+        with self.lock:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO summaries (cache_key, model, prompt_version, summary, created_at) VALUES (?, ?, ?, ?, ?)',
+                (cache_key, model, prompt_version, summary, datetime.now().isoformat())
+            )
+            self.conn.commit()
+    
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+def country_demonyms(country_keywords: List[str]) -> Dict[str, str]:
+    """Word-form aliases ('indian', 'south korean') of the given countries, from the alias table.
+    
+    ISO codes are left out: as plain words ('in', 'can', 'us') they would match everywhere.
+    """
+    wanted = {country.lower() for country in country_keywords}
+    demonyms = {}
+    for canonical, aliases in COUNTRY_ALIASES.items():
+        if canonical.lower() not in wanted:
+            continue
+        for alias in aliases:
+            if len(alias) > 3 and alias not in wanted:
+                demonyms[alias] = canonical.lower()
+    return demonyms
+
+class KeywordMatcher:
+    """Finds F1 keywords and country names in a single regex pass over the text.
+    
+    All phrases are compiled into one prefix-factored (trie-shaped) alternation, so
+    the regex engine walks the text once instead of once per keyword. Matches must
+    sit on word boundaries and the longest phrase wins, so 'niger' no longer fires
+    inside 'nigeria' and 'opt' no longer fires inside 'option'. Plural forms
+    ('students', 'universities') and country aliases such as demonyms ('indian')
+    are matched too, and reported as the phrase they belong to.
+    """
+    def __init__(self, f1_keywords: List[str], country_keywords: List[str],
+                 country_aliases: Optional[Dict[str, str]] = None):
+        # Matched text -> {kind: keyword or country it stands for}
+        self.phrases: Dict[str, Dict[str, str]] = {}
+        entries = [('f1', keyword.lower(), keyword.lower()) for keyword in f1_keywords]
+        entries += [('country', country.lower(), country.lower()) for country in country_keywords]
+        entries += [('country', alias.lower(), country.lower()) for alias, country in (country_aliases or {}).items()]
+        for kind, text, phrase in entries:
+            self.phrases.setdefault(text, {}).setdefault(kind, phrase)
+        # Plurals only fill gaps, so a form that is a keyword of its own keeps its meaning
+        for kind, text, phrase in entries:
+            for form in self.plurals(text):
+                self.phrases.setdefault(form, {}).setdefault(kind, phrase)
+        # Every phrase starts and ends with a word character, so \b marks word boundaries
+        self.pattern = re.compile(r'\b' + self._trie_regex(list(self.phrases)) + r'\b')
+    
+    @staticmethod
+    def plurals(phrase: str) -> List[str]:
+        """Regular English plurals of a phrase's last word"""
+        if phrase.endswith(('s', 'x', 'z', 'ch', 'sh')):
+            return [phrase + 'es']
+        if phrase.endswith('y') and phrase[-2:-1] not in ('a', 'e', 'i', 'o', 'u'):
+            return [phrase[:-1] + 'ies', phrase + 's']
+        return [phrase + 's']
+    
+    @classmethod
+    def _trie_regex(cls, words: List[str]) -> str:
+        """Build a regex alternation that shares common prefixes, longest alternatives first"""
+        trie = {}
+        for word in words:
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[''] = {}
+        return cls._node_regex(trie)
+    
+    @classmethod
+    def _node_regex(cls, node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + cls._node_regex(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        # An empty branch (end of a word) goes last so longer phrases are tried first
+        optional = '' in node
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ('|' if optional else '') + ')'
+    
+    def match(self, text: str) -> Dict[str, List[str]]:
+        """Return the F1 keywords and countries found in text, in order of first appearance"""
+        hits = {'f1': [], 'country': []}
+        seen = set()
+        for found in self.pattern.finditer(text.lower()):
+            for kind, phrase in self.phrases[found.group()].items():
+                if (kind, phrase) not in seen:
+                    seen.add((kind, phrase))
+                    hits[kind].append(phrase)
+        return hits
+
+class PipelineStage:
+    """A pool of worker threads applying one step to items from a bounded queue.
+    
+    Results other than None go to the next stage's queue. DONE flows through the
+    queues: once every worker of a stage has seen it, the stage passes it on.
+    """
+    DONE = object()
+    
+    def __init__(self, name: str, handler, workers: int, inbox: queue.Queue, outbox: Optional[queue.Queue] = None):
+        self.name = name
+        self.handler = handler
+        self.inbox = inbox
+        self.outbox = outbox
+        self.remaining = max(1, workers)
+        self.lock = threading.Lock()
+        self.threads = [threading.Thread(target=self.work, name=f"{name}-{i}", daemon=True)
+                        for i in range(self.remaining)]
+    
+    def start(self):
+        for thread in self.threads:
+            thread.start()
+    
+    def join(self):
+        for thread in self.threads:
+            thread.join()
+    
+    def work(self):
+        while True:
+            item = self.inbox.get()
+            if item is self.DONE:
+                self.inbox.put(self.DONE)  # let the other workers of this stage see it
+                break
+            try:
+                result = self.handler(item)
+            except Exception as e:
+                print(f"Error in {self.name} stage: {str(e)}")
+                continue
+            if result is not None and self.outbox is not None:
+                self.outbox.put(result)
+        
+        with self.lock:
+            self.remaining -= 1
+            last = self.remaining == 0
+        if last and self.outbox is not None:
+            self.outbox.put(self.DONE)
+
+class URLFrontier:
+    """Canonicalized, scope-filtered set of article URLs discovered on listing pages.
+    
+    Each URL is kept once with the date shown next to it on a listing (if any);
+    ranked() hands them out newest first, undated links last.
+    """
+    # Article pages: /newsroom/<section>/<slug> (news releases, alerts, news, ...)
+    ALLOW_PATTERNS = (r'^/newsroom/[\w-]+/[^/]+$', r'^/news/[^/]+$')
+    # Downloads, feeds and print views are never article pages
+    DENY_PATTERNS = (r'\.(?:pdf|jpe?g|png|gif|docx?|xlsx?|pptx?|zip|mp4)$', r'/(?:feed|rss|print)$')
+    
+    def __init__(self, base_url: str, allowed_hosts: Optional[List[str]] = None,
+                 allow_patterns=ALLOW_PATTERNS, deny_patterns=DENY_PATTERNS):
+        self.base_url = base_url
+        self.allowed_hosts = set(allowed_hosts or [urlparse(base_url).hostname])
+        self.allow = [re.compile(pattern) for pattern in allow_patterns]
+        self.deny = [re.compile(pattern, re.IGNORECASE) for pattern in deny_patterns]
+        self.urls: Dict[str, Optional[str]] = {}  # canonical URL -> listing date, in discovery order
+        self.out_of_scope = 0
+        self.duplicates = 0
+    
+    def canonicalize(self, href: str) -> Optional[str]:
+        """Absolute URL with a lowercase scheme and host, no fragment, query or trailing slash"""
+        parts = urlsplit(urljoin(self.base_url, href.strip()))
+        scheme = parts.scheme.lower()
+        if scheme not in ('http', 'https') or not parts.hostname:
+            return None
+        netloc = parts.hostname.lower()
+        if parts.port and parts.port != {'http': 80, 'https': 443}[scheme]:
+            netloc += f":{parts.port}"
+        path = re.sub(r'/{2,}', '/', parts.path) or '/'
+        if len(path) > 1:
+            path = path.rstrip('/')
+        # Article pages take no parameters; queries are tracking tags or sort orders
+        return urlunsplit((scheme, netloc, path, '', ''))
+    
+    def in_scope(self, url: str) -> bool:
+        """True if a canonical URL is an article page on an allowed host"""
+        parts = urlsplit(url)
+        if parts.hostname not in self.allowed_hosts:
+            return False
+        if any(pattern.search(parts.path) for pattern in self.deny):
+            return False
+        return any(pattern.search(parts.path) for pattern in self.allow)
+    
+    def add(self, href: str, published_at: Optional[str] = None) -> bool:
+        """Add a link; returns True if it is a new in-scope article URL"""
+        url = self.canonicalize(href)
+        if not url or not self.in_scope(url):
+            self.out_of_scope += 1
+            return False
+        if url in self.urls:
+            self.duplicates += 1
+            if published_at and not self.urls[url]:
+                self.urls[url] = published_at
+            return False
+        self.urls[url] = published_at
+        return True
+    
+    @staticmethod
+    def priority(published_at: Optional[str]) -> Tuple[int, int]:
+        """Sort key: listing-dated links first, newest first; undated links keep discovery order"""
+        if not published_at:
+            return (1, 0)
+        return (0, -datetime.fromisoformat(published_at[:10]).toordinal())
+    
+    def ranked(self, wanted=None) -> List[str]:
+        """URLs in priority order, optionally only those for which wanted(url, published_at) holds"""
+        items = [(url, published_at) for url, published_at in self.urls.items()
+                 if wanted is None or wanted(url, published_at)]
+        return [url for url, published_at in sorted(items, key=lambda item: self.priority(item[1]))]
+    
+    def __len__(self) -> int:
+        return len(self.urls)
+    
+    def __contains__(self, href: str) -> bool:
+        return self.canonicalize(href) in self.urls
 
 class USCISF1NewsScraper:
-    def __init__(self, openai_api_key: str):
+    # Bump SUMMARY_PROMPT_VERSION whenever the prompt changes so cached summaries are regenerated
+    SUMMARY_MODEL = "gpt-3.5-turbo"
+    SUMMARY_PROMPT_VERSION = "1"
+    # How many ancestors of a listing link are searched for its date
+    LISTING_DATE_DEPTH = 3
+    SUMMARY_SYSTEM_PROMPT = "You are a helpful assistant that summarizes immigration news related to F1 students. Focus on key policy changes, requirements, and important information for international students."
+    SUMMARY_UNAVAILABLE = "Summary unavailable"
+    
+    def __init__(self, openai_api_key: str, max_workers: int = 8,
+                 requests_per_second: float = 5.0, burst: float = 1.0,
+                 request_timeout: float = 30, cache_dir: Optional[str] = '.http_cache',
+                 cache_max_bytes: int = 100 * 1024 * 1024,
+                 seen_store_path: Optional[str] = None, recheck_seen: bool = False,
+                 openai_client: Any = None, summary_cache_path: Optional[str] = 'summaries.db',
+                 summary_workers: int = 4, summary_max_retries: int = 3,
+                 window_days: int = 1, window_since: Optional[str] = None,
+                 window_until: Optional[str] = None, max_listing_pages: int = 10,
+                 html_parser: str = 'auto', discovery: str = 'auto',
+                 feed_urls: Optional[List[str]] = None, sitemap_urls: Optional[List[str]] = None,
+                 max_feed_documents: int = 20, pipeline_queue_size: int = 32):
         self.base_url = "https://www.uscis.gov"
         self.news_url = "https://www.uscis.gov/newsroom"
-        self.session = requests.Session()
+        
+        # Conditional-GET cache so unchanged pages are not downloaded again
+        self.http_cache = HTTPCache(cache_dir, cache_max_bytes) if cache_dir else None
+        self.session = CachedSession(self.http_cache) if self.http_cache else requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
         
-        # Initialize OpenAI client
-        self.openai_client = OpenAI(api_key=openai_api_key)
+        # Concurrent fetching: the pool must be large enough for every worker
+        self.max_workers = max(1, max_workers)
+        self.request_timeout = request_timeout
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=self.max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Per-host rate limiter replaces the fixed delay between articles
+        self.rate_limiter = HostRateLimiter(requests_per_second, burst)
+        self.request_latencies = []
+        self.latency_lock = threading.Lock()
+        
+        # Bounded queues between the run_scraper pipeline stages
+        self.pipeline_queue_size = max(1, pipeline_queue_size)
+        
+        # Link discovery: 'feeds' (RSS/Atom + sitemaps), 'html' (listing pages) or 'auto' (feeds, else html)
+        self.discovery = discovery
+        self.feed_urls = feed_urls or []
+        self.sitemap_urls = sitemap_urls or []
+        self.max_feed_documents = max(1, max_feed_documents)
+        
+        # Article pages are parsed with lxml/XPath when available, BeautifulSoup otherwise
+        self.article_parser = get_article_parser(html_parser)
+        
+        # Crawl window: the last window_days days, or an explicit since/until date range
+        self.window_days = max(1, window_days)
+        self.window_since = window_since
+        self.window_until = window_until
+        self.max_listing_pages = max(1, max_listing_pages)
+        
+        # Incremental mode: remember what earlier runs already processed
+        self.seen_store = SeenURLStore(seen_store_path) if seen_store_path else None
+        self.recheck_seen = recheck_seen
+        
+        # Initialize OpenAI client (any object with the same chat.completions.create API works)
+        self.openai_client = openai_client if openai_client is not None else OpenAI(api_key=openai_api_key)
+        self.summary_cache = SummaryCache(summary_cache_path) if summary_cache_path else None
+        self.summary_workers = max(1, summary_workers)
+        self.summary_max_retries = summary_max_retries
+        self.summary_api_calls = 0
+        self.summary_cache_hits = 0
+        self.summary_lock = threading.Lock()
+        # Summary key -> Future, so duplicate articles in the pipeline share one request
+        self.summary_futures: Dict[str, Future] = {}
         
         # Keywords related to F1 students
         self.f1_keywords = [
@@ -83,279 +695,608 @@ class USCISF1NewsScraper:
             'samoa', 'tonga', 'kiribati', 'tuvalu', 'nauru', 'palau',
             'marshall islands', 'micronesia'
         ]
+        
+        # One precompiled automaton answers both keyword and country questions
+        self.keyword_matcher = KeywordMatcher(self.f1_keywords, self.country_keywords, country_demonyms(self.country_keywords))
+        # (country index, resolver) for the index last passed to search_by_country
+        self.country_resolver: Optional[Tuple[Dict[str, List[int]], CountryResolver]] = None
     
-    def is_today_news(self, date_str: str) -> bool:
+    def is_today_news(self, date_str: str, source: str = '') -> bool:
         """Check if news is from today only"""
-        if not date_str:
-            return False  # Exclude if no date available
+        published_at = date_normalizer.to_iso(date_str, source)
+        return self.is_published_today(published_at)
+    
+    def is_published_today(self, published_at: Optional[str]) -> bool:
+        """Check a precomputed ISO timestamp against today's date"""
+        if not published_at:
+            return False  # Exclude if no date available or it could not be parsed
+        return published_at[:10] == datetime.now().strftime('%Y-%m-%d')
+    
+    def window_bounds(self) -> Tuple[str, str]:
+        """First and last day (ISO dates) of the crawl window"""
+        today = datetime.now()
+        since = self.window_since or (today - timedelta(days=self.window_days - 1)).strftime('%Y-%m-%d')
+        until = self.window_until or today.strftime('%Y-%m-%d')
+        return since, until
+    
+    def window_label(self) -> str:
+        """Label for output file names: 'today', 'last7days' or '<since>_<until>'"""
+        if self.window_since or self.window_until:
+            since, until = self.window_bounds()
+            return f"{since.replace('-', '')}_{until.replace('-', '')}"
+        return 'today' if self.window_days == 1 else f"last{self.window_days}days"
+    
+    def is_in_window(self, published_at: Optional[str]) -> bool:
+        """Check a precomputed ISO timestamp against the crawl window"""
+        if not published_at:
+            return False  # Exclude if no date available or it could not be parsed
+        since, until = self.window_bounds()
+        return since <= published_at[:10] <= until
+    
+    def listing_date(self, link, source: str = '') -> Optional[str]:
+        """ISO timestamp of the date shown next to a link on a listing page, if any"""
+        node = link
+        for _ in range(self.LISTING_DATE_DEPTH):
+            node = node.parent
+            if node is None:
+                break
+            # Stop at a container holding other items; a date found there may belong to one of them
+            if len({a['href'] for a in node.find_all('a', href=True)}) > 1:
+                break
+            time_elem = node.find('time')
+            if time_elem:
+                text = time_elem.get('datetime') or time_elem.get_text()
+            else:
+                match = LISTING_DATE_RE.search(node.get_text(' '))
+                text = match.group(0) if match else None
+            if text:
+                return date_normalizer.to_iso(text.strip(), source)
+        return None
+    
+    def scan_news_listings(self, frontier: URLFrontier):
+        """Discover article links from the rendered newsroom listing pages; each listing is best effort"""
+        # Look for news items on the main newsroom page
+        try:
+            self.scan_listing(self.news_url, frontier, paginate=False)
+        except Exception as e:
+            print(f"Error scraping newsroom: {str(e)}")
         
+        # Also try to find specific news release pages
+        news_releases_url = "https://www.uscis.gov/newsroom/news-releases"
         try:
-            from datetime import datetime
-            
-            # Try different date formats
-            date_formats = [
-                '%Y-%m-%d',
-                '%B %d, %Y',
-                '%b %d, %Y',
-                '%m/%d/%Y',
-                '%d/%m/%Y',
-                '%Y-%m-%d %H:%M:%S',
-                '%d %B %Y',
-                '%d %b %Y',
-                '%B %d, %Y',
-                '%b %d, %Y'
-            ]
-            
-            article_date = None
-            for fmt in date_formats:
-                try:
-                    article_date = datetime.strptime(date_str.strip(), fmt)
-                    break
-                except ValueError:
-                    continue
-            
-            if not article_date:
-                return False  # Exclude if can't parse date
-            
-            # Check if from today
-            today = datetime.now().date()
-            return article_date.date() == today
-            
+            self.scan_listing(news_releases_url, frontier)
         except Exception as e:
-            print(f"Error parsing date '{date_str}': {str(e)}")
-            return False  # Exclude if error parsing
-    
-    def scrape_news_pages(self) -> List[Dict[str, Any]]:
-        """Scrape all news pages from USCIS (today only)"""
-        all_news = []
+            print(f"Error scraping news releases: {str(e)}")
         
+        # Try to get all news page
+        all_news_url = "https://www.uscis.gov/newsroom/all-news"
         try:
-            # Get main newsroom page
-            response = self.session.get(self.news_url)
-            response.raise_for_status()
+            self.scan_listing(all_news_url, frontier)
+        except Exception as e:
+            print(f"Error scraping all news: {str(e)}")
+    
+    def scan_listing(self, url: str, frontier: URLFrontier, paginate: bool = True):
+        """Add a listing's article links (with their listing dates) to the frontier, newest page first.
+        
+        Pagination stops at the first page whose oldest listing date is before the
+        window, or that adds no new links or shows no dates at all.
+        """
+        since, _ = self.window_bounds()
+        source = DateNormalizer.source_of(url)
+        for page in range(self.max_listing_pages if paginate else 1):
+            response = self.fetch(url if page == 0 else f"{url}?page={page}")
             soup = BeautifulSoup(response.content, 'html.parser')
             
-            # Find all news links
-            news_links = []
-            
-            # Look for news items in different sections
+            new_links = 0
+            dates = []
             for link in soup.find_all('a', href=True):
-                href = link['href']
-                if '/newsroom/' in href or '/news/' in href:
-                    if href.startswith('/'):
-                        href = self.base_url + href
-                    news_links.append(href)
+                published_at = self.listing_date(link, source)
+                if frontier.add(link['href'], published_at):
+                    new_links += 1
+                    if published_at:
+                        dates.append(published_at)
             
-            # Also try to find specific news release pages
-            news_releases_url = "https://www.uscis.gov/newsroom/news-releases"
-            try:
-                response = self.session.get(news_releases_url)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                for link in soup.find_all('a', href=True):
-                    href = link['href']
-                    if '/newsroom/news-releases/' in href and href not in news_links:
-                        if href.startswith('/'):
-                            href = self.base_url + href
-                        news_links.append(href)
-            except Exception as e:
-                print(f"Error scraping news releases: {str(e)}")
-            
-            # Try to get all news page
-            all_news_url = "https://www.uscis.gov/newsroom/all-news"
+            if not new_links or not dates or min(dates)[:10] < since:
+                break
+    
+    def find_sitemaps(self) -> List[str]:
+        """Sitemap URLs announced in robots.txt, or the conventional /sitemap.xml"""
+        try:
+            response = self.fetch(f"{self.base_url}/robots.txt")
+            sitemaps = [line.split(':', 1)[1].strip() for line in response.text.splitlines()
+                        if line.lower().startswith('sitemap:')]
+            if sitemaps:
+                return sitemaps
+        except Exception as e:
+            print(f"Error reading robots.txt: {str(e)}")
+        return [f"{self.base_url}/sitemap.xml"]
+    
+    def iter_feed_entries(self, url: str):
+        """Stream (kind, link, date) entries out of a sitemap, sitemap index, RSS or Atom document.
+        
+        kind is the entry element: 'url' or 'sitemap' (date is lastmod), 'item' or 'entry'
+        (date is the publication date). Each entry is discarded once read.
+        """
+        response = self.fetch(url)
+        # Open elements, so a finished entry can be detached from its parent (urlset, channel or feed)
+        open_elements = []
+        for event, elem in ElementTree.iterparse(io.BytesIO(response.content), events=('start', 'end')):
+            if event == 'start':
+                open_elements.append(elem)
+                continue
+            open_elements.pop()
+            kind = elem.tag.rsplit('}', 1)[-1]
+            if kind not in FEED_ENTRY_TAGS:
+                continue
+            values = {}
+            for child in elem:
+                name = child.tag.rsplit('}', 1)[-1]
+                if name == 'link' and child.get('href'):
+                    # Atom: <link rel="alternate" href="..."/>
+                    if child.get('rel', 'alternate') == 'alternate':
+                        values.setdefault('link', child.get('href'))
+                elif child.text and child.text.strip():
+                    values.setdefault(name, child.text.strip())
+            link = values.get('loc') or values.get('link')
+            date = values.get('lastmod') or values.get('pubDate') or values.get('published') or values.get('updated')
+            yield kind, link, date
+            # Clearing alone would leave an empty element per entry in the tree
+            if open_elements:
+                open_elements[-1].remove(elem)
+    
+    def discover_from_feeds(self, frontier: URLFrontier) -> Tuple[int, int]:
+        """Add article links from the RSS/Atom feeds and sitemaps.
+        
+        Feed dates are publication dates and go into the frontier like listing dates.
+        Sitemap lastmod values only bound the publication date from above, so they
+        just rule out URLs (and child sitemaps) last modified before the window.
+        Sitemap URLs without a lastmod are skipped, or a sitemap listing the whole
+        newsroom would turn every run into a full crawl.
+        Returns (documents read, undated sitemap URLs skipped).
+        """
+        since, _ = self.window_bounds()
+        documents = 0
+        undated = 0
+        pending = list(self.feed_urls) + list(self.sitemap_urls or self.find_sitemaps())
+        visited = set()
+        while pending and len(visited) < self.max_feed_documents:
+            url = pending.pop(0)
+            if url in visited:
+                continue
+            visited.add(url)
+            source = DateNormalizer.source_of(url)
             try:
-                response = self.session.get(all_news_url)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                for link in soup.find_all('a', href=True):
-                    href = link['href']
-                    if ('/newsroom/' in href or '/news/') and href not in news_links:
-                        if href.startswith('/'):
-                            href = self.base_url + href
-                        news_links.append(href)
+                for kind, link, date in self.iter_feed_entries(url):
+                    if not link:
+                        continue
+                    published_at = date_normalizer.to_iso(date, source) if date else None
+                    if kind in ('item', 'entry'):
+                        frontier.add(link, published_at)
+                    elif published_at and published_at[:10] < since:
+                        continue
+                    elif kind == 'sitemap':
+                        pending.append(link)
+                    elif published_at:
+                        frontier.add(link)
+                    elif frontier.in_scope(frontier.canonicalize(link) or ''):
+                        undated += 1
+                documents += 1
             except Exception as e:
-                print(f"Error scraping all news: {str(e)}")
-            
-            # Remove duplicates
-            news_links = list(set(news_links))
-            
-            print(f"Found {len(news_links)} news links to process")
+                print(f"Error reading feed {url}: {str(e)}")
+        return documents, undated
+    
+    def discover_news_links(self) -> List[str]:
+        """Article URLs to fetch for the crawl window, newest first"""
+        # Article URLs, canonicalized and deduplicated, with the dates shown on the listings
+        frontier = URLFrontier(self.base_url)
+        
+        # Feeds and sitemaps are small and dated; rendered listings are the fallback
+        feed_documents = undated = 0
+        if self.discovery != 'html':
+            feed_documents, undated = self.discover_from_feeds(frontier)
+            print(f"Read {feed_documents} feed/sitemap document(s), skipped {undated} sitemap URLs without lastmod")
+        
+        # Listings also date the pages an undated sitemap could not
+        if self.discovery == 'html' or (self.discovery == 'auto' and (not feed_documents or undated)):
+            self.scan_news_listings(frontier)
+        
+        print(f"Found {len(frontier)} news links ({frontier.out_of_scope} non-article links ignored, "
+              f"{frontier.duplicates} duplicates)")
+        
+        # Links dated outside the window on a listing page are never fetched; the rest go newest first
+        news_links = frontier.ranked(lambda url, published_at: published_at is None or self.is_in_window(published_at))
+        print(f"Listing dates: skipping {len(frontier) - len(news_links)} links outside the window")
+        
+        # Incremental mode: only new links are fetched unless asked to recheck them
+        if self.seen_store and not self.recheck_seen:
+            new_links = [link for link in news_links if self.needs_crawl(link)]
+            print(f"Incremental mode: skipping {len(news_links) - len(new_links)} already processed links")
+            news_links = new_links
+        
+        print(f"Processing {len(news_links)} news links")
+        return news_links
+    
+    def needs_crawl(self, url: str) -> bool:
+        """Incremental mode: True unless the URL was finished, or its stored date is outside this run's window"""
+        record = self.seen_store.get(url)
+        if not record:
+            return True
+        if record['state'] == 'out_of_window':
+            # Undated articles are fetched again, since the page may carry a date by now
+            published_at = date_normalizer.to_iso(record['parsed_date'], DateNormalizer.source_of(url))
+            return published_at is None or self.is_in_window(published_at)
+        return record['state'] not in SeenURLStore.DONE_STATES
+    
+    def finish_crawl(self):
+        """Report fetch latency and persist the HTTP cache index"""
+        self.print_latency_stats()
+        if self.http_cache:
+            self.http_cache.save()
+            self.print_cache_stats()
+    
+    def scrape_news_pages(self) -> List[Article]:
+        """Scrape all news pages from USCIS published in the crawl window (today by default)"""
+        all_news = []
+        
+        try:
+            news_links = self.discover_news_links()
             
-            # Process each news link
-            for i, link in enumerate(news_links):
-                try:
-                    print(f"Processing news link {i+1}/{len(news_links)}: {link}")
-                    news_content = self.scrape_news_article(link)
-                    if news_content:
-                        # Filter for today's news only
-                        if self.is_today_news(news_content.get('date', '')):
+            # Process news links concurrently; the rate limiter keeps us polite
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                articles = executor.map(self.scrape_news_article, news_links)
+                for i, (link, news_content) in enumerate(zip(news_links, articles)):
+                    try:
+                        print(f"Processed news link {i+1}/{len(news_links)}: {link}")
+                        if news_content and self.check_window(news_content):
                             all_news.append(news_content)
-                            print(f"  ✓ Today's news: {news_content['title'][:50]}...")
-                        else:
-                            print(f"  ✗ Not today's news (skipped): {news_content['title'][:50]}...")
-                    
-                    # Be respectful with delays
-                    time.sleep(1)
                     
-                except Exception as e:
-                    print(f"Error processing {link}: {str(e)}")
-                    continue
+                    except Exception as e:
+                        print(f"Error processing {link}: {str(e)}")
+                        continue
             
         except Exception as e:
             print(f"Error scraping news pages: {str(e)}")
         
+        self.finish_crawl()
         return all_news
     
-    def scrape_news_article(self, url: str) -> Dict[str, Any]:
-        """Scrape individual news article"""
+    def fetch(self, url: str) -> requests.Response:
+        """Rate-limited GET that records request latency"""
+        self.rate_limiter.acquire(url)
+        start = time.perf_counter()
         try:
-            response = self.session.get(url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = self.session.get(url, timeout=self.request_timeout)
+        finally:
+            with self.latency_lock:
+                self.request_latencies.append(time.perf_counter() - start)
+        response.raise_for_status()
+        return response
+    
+    def get_latency_stats(self) -> Dict[str, Any]:
+        """Summarize per-request latencies (seconds) recorded by fetch"""
+        with self.latency_lock:
+            latencies = sorted(self.request_latencies)
+        if not latencies:
+            return {'count': 0}
+        
+        def percentile(p: float) -> float:
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))]
+        
+        return {
+            'count': len(latencies),
+            'min': latencies[0],
+            'mean': sum(latencies) / len(latencies),
+            'p50': percentile(0.50),
+            'p95': percentile(0.95),
+            'max': latencies[-1],
+            'total': sum(latencies)
+        }
+    
+    def print_latency_stats(self):
+        """Print request latency statistics"""
+        stats = self.get_latency_stats()
+        if not stats['count']:
+            print("No requests made")
+            return
+        print(f"Requests: {stats['count']} | latency min {stats['min']:.3f}s, "
+              f"mean {stats['mean']:.3f}s, p50 {stats['p50']:.3f}s, "
+              f"p95 {stats['p95']:.3f}s, max {stats['max']:.3f}s")
+    
+    def print_cache_stats(self):
+        """Print HTTP cache hit/miss counters"""
+        stats = self.http_cache.stats()
+        print(f"HTTP cache: {stats['hits']} hits, {stats['misses']} misses "
+              f"({stats['hit_rate']:.0%} hit rate), {stats['evictions']} evictions, "
+              f"{stats['entries']} entries / {stats['bytes'] / 1024:.0f} KB")
+    
+    def fetch_article(self, url: str) -> Optional[Tuple[str, bytes, Optional[str]]]:
+        """Download an article page; returns (url, body, content hash) or None if skipped or failed"""
+        try:
+            response = self.fetch(url)
             
-            # Extract title
-            title_elem = soup.find('h1') or soup.find('title')
-            title = title_elem.get_text().strip() if title_elem else "No title found"
+            # Incremental mode: skip parsing pages whose content has not changed
+            content_hash = None
+            if self.seen_store:
+                content_hash = getattr(response, 'body_hash', None) or hashlib.sha256(response.content).hexdigest()
+                if self.seen_store.is_done(url, content_hash):
+                    print(f"  = Unchanged since last run (skipped): {url}")
+                    return None
             
-            # Extract content
-            content = ""
-            content_elem = soup.find('div', class_='field--name-body') or soup.find('main') or soup.find('article')
-            if content_elem:
-                content = content_elem.get_text().strip()
-            else:
-                # Fallback: get all paragraph text
-                paragraphs = soup.find_all('p')
-                content = ' '.join([p.get_text().strip() for p in paragraphs])
+            return url, response.content, content_hash
             
-            # Extract date
-            date = None
-            date_elem = soup.find('time') or soup.find('span', class_='date')
-            if date_elem:
-                date = date_elem.get_text().strip()
+        except Exception as e:
+            print(f"Error scraping article {url}: {str(e)}")
+            return None
+    
+    def parse_article(self, page: Tuple[str, bytes, Optional[str]]) -> Optional[Article]:
+        """Build an Article from a downloaded page"""
+        url, body, content_hash = page
+        try:
+            # Extract title, content, date and author
+            fields = self.article_parser.parse(body)
             
-            # Extract author
-            author = None
-            author_elem = soup.find('span', class_='author') or soup.find('div', class_='author')
-            if author_elem:
-                author = author_elem.get_text().strip()
+            if self.seen_store:
+                self.seen_store.record(url, content_hash, fields['date'], 'fetched')
             
-            return {
-                'url': url,
-                'title': title,
-                'content': content,
-                'date': date,
-                'author': author,
-                'scraped_at': datetime.now().isoformat()
-            }
+            return Article(
+                url=url,
+                published_at=date_normalizer.to_iso(fields['date'], DateNormalizer.source_of(url)),
+                scraped_at=datetime.now().isoformat(),
+                **fields
+            )
             
         except Exception as e:
             print(f"Error scraping article {url}: {str(e)}")
             return None
     
+    def scrape_news_article(self, url: str) -> Optional[Article]:
+        """Scrape individual news article"""
+        page = self.fetch_article(url)
+        return self.parse_article(page) if page else None
+    
+    def check_window(self, article: Article) -> bool:
+        """Keep an article only if its own date is in the window (listing dates only prefilter)"""
+        if self.is_in_window(article.published_at):
+            print(f"  ✓ In window: {article.title[:50]}...")
+            return True
+        print(f"  ✗ Outside window (skipped): {article.title[:50]}...")
+        if self.seen_store:
+            self.seen_store.set_state(article.url, 'out_of_window')
+        return False
+    
+    def classify(self, text: str) -> Dict[str, Any]:
+        """Check F1 relevance and extract countries in one pass over the text"""
+        hits = self.keyword_matcher.match(text)
+        return {
+            'is_f1_related': bool(hits['f1']),
+            'f1_keywords': hits['f1'],
+            'countries': [country.title() for country in hits['country']]
+        }
+    
     def is_f1_related(self, text: str) -> bool:
         """Check if content is related to F1 students"""
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in self.f1_keywords)
+        return self.classify(text)['is_f1_related']
     
     def extract_countries(self, text: str) -> List[str]:
         """Extract country mentions from text"""
-        text_lower = text.lower()
-        found_countries = []
-        
-        for country in self.country_keywords:
-            if country in text_lower:
-                found_countries.append(country.title())
-        
-        return list(set(found_countries))
+        return self.classify(text)['countries']
+    
+    def request_summary(self, content: str) -> str:
+        """Call the chat completion API once, retrying with exponential backoff"""
+        for attempt in range(self.summary_max_retries + 1):
+            try:
+                with self.summary_lock:
+                    self.summary_api_calls += 1
+                response = self.openai_client.chat.completions.create(
+                    model=self.SUMMARY_MODEL,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": self.SUMMARY_SYSTEM_PROMPT
+                        },
+                        {
+                            "role": "user",
+                            "content": f"Please summarize the following USCIS news content, focusing on information relevant to F1 students:\n\n{content}"
+                        }
+                    ],
+                    max_tokens=300,
+                    temperature=0.3
+                )
+                
+                return response.choices[0].message.content.strip()
+            
+            except Exception as e:
+                if attempt == self.summary_max_retries:
+                    raise
+                delay = (2 ** attempt) + random.uniform(0, 1)
+                print(f"Error summarizing with OpenAI (attempt {attempt + 1}), retrying in {delay:.1f}s: {str(e)}")
+                time.sleep(delay)
     
     def summarize_with_openai(self, content: str) -> str:
-        """Summarize content using OpenAI"""
+        """Summarize content using OpenAI, from the cache when possible"""
+        return self.summarize_content(content)
+    
+    def summarize_and_cache(self, key: str, content: str) -> str:
+        """Summarize one article and store the result; failures are not cached"""
         try:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a helpful assistant that summarizes immigration news related to F1 students. Focus on key policy changes, requirements, and important information for international students."
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Please summarize the following USCIS news content, focusing on information relevant to F1 students:\n\n{content}"
-                    }
-                ],
-                max_tokens=300,
-                temperature=0.3
-            )
-            
-            return response.choices[0].message.content.strip()
-            
+            summary = self.request_summary(content)
         except Exception as e:
             print(f"Error summarizing with OpenAI: {str(e)}")
-            return "Summary unavailable"
+            return self.SUMMARY_UNAVAILABLE
+        if self.summary_cache:
+            self.summary_cache.put(key, self.SUMMARY_MODEL, self.SUMMARY_PROMPT_VERSION, summary)
+        return summary
+    
+    def classify_article(self, article: Article) -> bool:
+        """Tag an article with its countries if it is F1 related"""
+        classification = self.classify(f"{article.title} {article.content}")
+        if classification['is_f1_related']:
+            article['countries'] = classification['countries']
+            article['is_f1_related'] = True
+            return True
+        if self.seen_store:
+            self.seen_store.set_state(article.url, 'not_f1')
+        return False
+    
+    def summarize_article(self, article: Article) -> Article:
+        """Attach a summary to an article"""
+        article['summary'] = self.summarize_content(article.content)
+        return article
+    
+    def summarize_content(self, content: str) -> str:
+        """Summary of some content, from the cache when possible; a duplicate waits for the first copy's request"""
+        key = SummaryCache.make_key(content, self.SUMMARY_MODEL, self.SUMMARY_PROMPT_VERSION)
+        with self.summary_lock:
+            future = self.summary_futures.get(key)
+            first = future is None
+            if first:
+                future = self.summary_futures[key] = Future()
+        if not first:
+            return future.result()
+        
+        try:
+            cached = self.summary_cache.get(key) if self.summary_cache else None
+            if cached is not None:
+                with self.summary_lock:
+                    self.summary_cache_hits += 1
+                summary = cached
+            else:
+                summary = self.summarize_and_cache(key, content)
+        except Exception as e:
+            future.set_exception(e)
+            summary = None
+        else:
+            future.set_result(summary)
+        
+        # Failures are forgotten, so a later copy of the article tries again
+        if summary is None or summary == self.SUMMARY_UNAVAILABLE:
+            with self.summary_lock:
+                del self.summary_futures[key]
+        return future.result()
+    
+    def persist_article(self, article: Article, output_file: Optional[str] = None):
+        """Write a finished article to output_file (JSON Lines) and record it as processed"""
+        if output_file:
+            self.append_to_jsonl(article, output_file)
+        if self.seen_store:
+            # Without a summary the article is redone on the next incremental run
+            state = 'processed' if article.summary != self.SUMMARY_UNAVAILABLE else 'summary_failed'
+            self.seen_store.set_state(article.url, state)
     
-    def process_and_filter_news(self, all_news: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Process news and filter for F1 related content"""
+    def process_and_filter_news(self, all_news: List[Article], output_file: Optional[str] = None) -> List[Article]:
+        """Process news and filter for F1 related content, appending each finished article to output_file (JSON Lines)"""
+        f1_news = [article for article in all_news if self.classify_article(article)]
+        
+        # Summarize with OpenAI, concurrently and from cache where possible
+        with ThreadPoolExecutor(max_workers=self.summary_workers) as executor:
+            for article in executor.map(self.summarize_article, f1_news):
+                self.persist_article(article, output_file)
+        
+        print(f"Summaries: {self.summary_cache_hits} from cache, {self.summary_api_calls} API calls")
+        return f1_news
+    
+    def run_pipeline(self, output_file: Optional[str] = None) -> List[Article]:
+        """Crawl, classify, summarize and persist articles as a streaming pipeline.
+        
+        Stages are thread pools joined by bounded queues, so fetching, parsing and
+        summarization overlap and each finished article is written immediately.
+        """
         f1_news = []
         
-        for article in all_news:
-            # Check if article is F1 related
-            full_text = f"{article['title']} {article['content']}"
-            if self.is_f1_related(full_text):
-                # Extract countries
-                countries = self.extract_countries(full_text)
-                
-                # Summarize with OpenAI
-                summary = self.summarize_with_openai(article['content'])
-                
-                # Add processed data
-                article['countries'] = countries
-                article['summary'] = summary
-                article['is_f1_related'] = True
-                
-                f1_news.append(article)
+        def parse(page: Tuple[str, bytes, Optional[str]]) -> Optional[Article]:
+            article = self.parse_article(page)
+            if article and self.check_window(article) and self.classify_article(article):
+                return article
+            return None
+        
+        def persist(article: Article):
+            self.persist_article(article, output_file)
+            f1_news.append(article)
+        
+        links, pages, articles, summarized = (queue.Queue(self.pipeline_queue_size) for _ in range(4))
+        stages = [
+            PipelineStage('fetch', self.fetch_article, self.max_workers, links, pages),
+            PipelineStage('parse', parse, 1, pages, articles),
+            PipelineStage('summarize', self.summarize_article, self.summary_workers, articles, summarized),
+            PipelineStage('persist', persist, 1, summarized)
+        ]
+        for stage in stages:
+            stage.start()
+        
+        try:
+            # Blocks whenever the fetchers fall behind, so memory stays bounded
+            for link in self.discover_news_links():
+                links.put(link)
+        except Exception as e:
+            print(f"Error scraping news pages: {str(e)}")
+        finally:
+            links.put(PipelineStage.DONE)
+            for stage in stages:
+                stage.join()
         
+        self.finish_crawl()
+        print(f"Summaries: {self.summary_cache_hits} from cache, {self.summary_api_calls} API calls")
+        # Stages finish articles out of order; list them newest first
+        f1_news.sort(key=lambda article: article.published_at or '', reverse=True)
         return f1_news
     
-    def save_to_json(self, data: List[Dict[str, Any]], filename: str):
-        """Save data to JSON file"""
+    def save_to_json(self, data: Any, filename: str, indent: Optional[int] = 2):
+        """Save data to JSON file (indent=None writes compact JSON)"""
+        separators = (',', ':') if indent is None else None
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            json.dump(data, f, indent=indent, ensure_ascii=False, separators=separators, default=json_default)
+    
+    def append_to_jsonl(self, article: Article, filename: str):
+        """Append one article as a line of JSON"""
+        with open(filename, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(article.to_dict(), ensure_ascii=False) + '\n')
     
-    def save_to_csv(self, data: List[Dict[str, Any]], filename: str):
+    def save_to_csv(self, data: List[Article], filename: str):
         """Save data to CSV file"""
-        df = pd.DataFrame(data)
+        df = pd.DataFrame([article.to_dict() for article in data])
         df.to_csv(filename, index=False, encoding='utf-8')
     
-    def create_searchable_database(self, f1_news: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Create searchable database by country"""
-        country_db = {}
+    def create_searchable_database(self, f1_news: List[Article]) -> Dict[str, Any]:
+        """Create searchable database by country.
         
-        for article in f1_news:
-            for country in article['countries']:
-                if country not in country_db:
-                    country_db[country] = []
-                country_db[country].append(article)
+        Each article is stored once in 'articles'; 'countries' maps a country
+        name to the ids (list positions) of the articles that mention it.
+        """
+        countries = {}
         
-        return country_db
-    
-    def search_by_country(self, country_db: Dict[str, Any], country: str) -> List[Dict[str, Any]]:
-        """Search news by country"""
-        country_lower = country.lower()
+        for article_id, article in enumerate(f1_news):
+            for country in article.countries:
+                if country not in countries:
+                    countries[country] = []
+                countries[country].append(article_id)
         
-        # Try exact match first
-        if country_lower.title() in country_db:
-            return country_db[country_lower.title()]
+        return {
+            'format': COUNTRY_DB_FORMAT,
+            'version': 2,
+            'articles': f1_news,
+            'countries': countries
+        }
+    
+    def country_resolver_for(self, countries: Dict[str, List[int]]) -> CountryResolver:
+        """Resolver over a country index, built once and reused while the same index is searched"""
+        cached = self.country_resolver
+        # The cache holds the index itself, so its identity cannot be reused by another dict
+        if cached is None or cached[0] is not countries:
+            cached = self.country_resolver = (countries, CountryResolver(countries))
+        return cached[1]
+    
+    def search_by_country(self, country_db: Dict[str, Any], country: str) -> List[Article]:
+        """Search news by country name, ISO code, demonym or alias"""
+        countries = country_db['countries']
+        articles = country_db['articles']
         
-        # Try case-insensitive match
-        for db_country, articles in country_db.items():
-            if country_lower in db_country.lower():
-                return articles
+        article_ids = set()
+        for name in self.country_resolver_for(countries).resolve(country):
+            article_ids.update(countries[name])
         
-        return []
+        return [articles[i] for i in sorted(article_ids)]
     
-    def create_sample_f1_news(self) -> List[Dict[str, Any]]:
+    def create_sample_f1_news(self) -> List[Article]:
         """Create sample F1 news for today only"""
         from datetime import datetime, timedelta
         
@@ -441,59 +1382,120 @@ class USCISF1NewsScraper:
                 'is_f1_related': True
             }
         ]
-        return sample_news
+        return [Article.from_dict(article) for article in sample_news]
     
-    def run_scraper(self):
-        """Main method to run the scraper (today only)"""
-        print("Starting USCIS F1 News Scraper (Today Only)...")
+    def run_scraper(self, output_format: str = 'json'):
+        """Main method to run the scraper over the crawl window (today by default)"""
+        label = self.window_label()
+        since, until = self.window_bounds()
+        print(f"Starting USCIS F1 News Scraper ({since} to {until})...")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Scrape all news from today only
-        print("Scraping news pages from today...")
-        all_news = self.scrape_news_pages()
-        print(f"Scraped {len(all_news)} today's articles")
+        # Every finished article is appended to the JSON Lines file right away, so an
+        # interrupted run keeps what it already processed
+        jsonl_file = f"f1_news_{label}_{timestamp}.jsonl"
         
-        # Process and filter for F1 related content
-        print("Processing and filtering for F1 related content...")
-        f1_news = self.process_and_filter_news(all_news)
-        print(f"Found {len(f1_news)} F1 related articles from today")
+        # Discover, fetch, parse, classify, summarize and persist as one streaming pipeline
+        print("Scraping and processing news in the window...")
+        f1_news = self.run_pipeline(jsonl_file)
+        print(f"Found {len(f1_news)} F1 related articles in the window")
         
         # Show real news only - no sample data
         if len(f1_news) == 0:
-            print("No F1 related articles found in real data from today.")
+            print("No F1 related articles found in real data for the window.")
         else:
-            print(f"Found {len(f1_news)} real F1 articles from today")
+            print(f"Found {len(f1_news)} real F1 articles in the window")
         
         # Create searchable database
         print("Creating searchable database...")
         country_db = self.create_searchable_database(f1_news)
         
         # Save results
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
         print("Saving results...")
-        self.save_to_json(f1_news, f"f1_news_today_{timestamp}.json")
-        self.save_to_csv(f1_news, f"f1_news_today_{timestamp}.csv")
-        self.save_to_json(country_db, f"f1_news_by_country_today_{timestamp}.json")
+        if output_format == 'json':
+            # The JSON Lines file was only a checkpoint; the JSON array replaces it
+            self.save_to_json(f1_news, f"f1_news_{label}_{timestamp}.json")
+            if os.path.exists(jsonl_file):
+                os.remove(jsonl_file)
+        self.save_to_csv(f1_news, f"f1_news_{label}_{timestamp}.csv")
+        self.save_to_json(country_db, f"f1_news_by_country_{label}_{timestamp}.json", indent=None)
         
         print(f"Scraping completed! Results saved with timestamp: {timestamp}")
         
         return f1_news, country_db
 
 def main():
+    parser = argparse.ArgumentParser(description='USCIS F1 News Scraper')
+    parser.add_argument('--workers', type=int, default=8, help='Number of concurrent article fetches')
+    parser.add_argument('--rate', type=float, default=5.0, help='Maximum requests per second per host')
+    parser.add_argument('--burst', type=float, default=1.0, help='Token bucket burst size per host')
+    parser.add_argument('--cache-dir', default='.http_cache', help='Directory for the conditional-GET HTTP cache')
+    parser.add_argument('--cache-size-mb', type=int, default=100, help='Maximum HTTP cache size in MB')
+    parser.add_argument('--no-cache', action='store_true', help='Disable the HTTP cache')
+    parser.add_argument('--incremental', action='store_true', help='Only fetch and process links not seen in earlier runs')
+    parser.add_argument('--state-db', default='seen_urls.db', help='SQLite store of seen URLs for --incremental')
+    parser.add_argument('--recheck', action='store_true', help='With --incremental, re-fetch seen links and reprocess changed ones')
+    parser.add_argument('--summary-workers', type=int, default=4, help='Concurrent OpenAI summarization requests')
+    parser.add_argument('--summary-cache', default='summaries.db', help='SQLite cache of article summaries')
+    parser.add_argument('--output-format', choices=['json', 'jsonl'], default='json',
+                        help='Article output: one JSON array at the end, or JSON Lines appended as articles finish')
+    parser.add_argument('--days', type=int, default=1, help='Crawl window: articles from the last N days (1 = today)')
+    parser.add_argument('--since', help='Crawl window start date (YYYY-MM-DD); overrides --days')
+    parser.add_argument('--until', help='Crawl window end date (YYYY-MM-DD, default today)')
+    parser.add_argument('--parser', choices=PARSERS, default='auto',
+                        help='Article page parser: lxml (fast, falls back to html.parser per page) or html.parser')
+    parser.add_argument('--discovery', choices=['auto', 'feeds', 'html'], default='auto',
+                        help='Find articles via RSS/Atom feeds and sitemaps, listing pages, or feeds with an HTML fallback')
+    parser.add_argument('--feed', action='append', default=[], help='RSS/Atom feed URL to read (repeatable)')
+    parser.add_argument('--sitemap', action='append', default=[],
+                        help='Sitemap URL to read (repeatable; default: from robots.txt)')
+    parser.add_argument('--queue-size', type=int, default=32, help='Capacity of each queue between pipeline stages')
+    parser.add_argument('--max-listing-pages', type=int, default=10, help='Maximum pages to follow on each news listing')
+    
+    args = parser.parse_args()
+    if args.rate <= 0:
+        parser.error('--rate must be positive')
+    if args.burst < 1:
+        parser.error('--burst must be at least 1')
+    if args.days < 1:
+        parser.error('--days must be at least 1')
+    # Window bounds are compared as strings, so they must be zero-padded ISO dates
+    for option in ('since', 'until'):
+        value = getattr(args, option)
+        if value:
+            try:
+                setattr(args, option, datetime.strptime(value, '%Y-%m-%d').strftime('%Y-%m-%d'))
+            except ValueError:
+                parser.error(f"--{option} must be a date in YYYY-MM-DD format, got {value!r}")
+    since = args.since or (datetime.now() - timedelta(days=args.days - 1)).strftime('%Y-%m-%d')
+    if args.until and since > args.until:
+        parser.error(f"the crawl window starts ({since}) after it ends ({args.until})")
+    
     # Initialize scraper with OpenAI API key
     openai_api_key = os.getenv('OPENAI_API_KEY', '')
     
-    scraper = USCISF1NewsScraper(openai_api_key)
+    scraper = USCISF1NewsScraper(openai_api_key, max_workers=args.workers,
+                                 requests_per_second=args.rate, burst=args.burst,
+                                 cache_dir=None if args.no_cache else args.cache_dir,
+                                 cache_max_bytes=args.cache_size_mb * 1024 * 1024,
+                                 seen_store_path=args.state_db if args.incremental else None,
+                                 recheck_seen=args.recheck,
+                                 summary_cache_path=args.summary_cache,
+                                 summary_workers=args.summary_workers,
+                                 window_days=args.days, window_since=args.since, window_until=args.until,
+                                 max_listing_pages=args.max_listing_pages, html_parser=args.parser,
+                                 discovery=args.discovery, feed_urls=args.feed, sitemap_urls=args.sitemap,
+                                 pipeline_queue_size=args.queue_size)
     
     try:
-        f1_news, country_db = scraper.run_scraper()
+        f1_news, country_db = scraper.run_scraper(args.output_format)
         
         # Display summary
         print("\n" + "="*50)
         print("SCRAPING SUMMARY")
         print("="*50)
         print(f"Total F1 related articles found: {len(f1_news)}")
-        print(f"Countries with F1 news: {list(country_db.keys())}")
+        print(f"Countries with F1 news: {list(country_db['countries'].keys())}")
         
         # Show sample results
         if f1_news:
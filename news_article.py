@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Article Records for F1 News
+Compact, slot-based article objects that round-trip the scraper's JSON shape
+"""
+
+import json
+import os
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+def intern_countries(countries: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    """Countries as a tuple of interned strings, so every article mentioning India shares one 'India'"""
+    return tuple(sys.intern(country) for country in countries) if countries else ()
+
+class ContentStore:
+    """Reads article content back out of a JSON Lines file on demand.
+
+    The file stays open, so content remains readable after the archive is replaced
+    on disk, and reads are positional, so forked workers never share a file offset.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.file = open(path, 'rb')
+
+    def read(self, offset: int, length: int) -> Optional[str]:
+        record = json.loads(os.pread(self.file.fileno(), length, offset))
+        return record.get('content')
+
+    def close(self):
+        self.file.close()
+
+# Positional reads keep lazy content safe across threads and forked workers
+LAZY_CONTENT_SUPPORTED = hasattr(os, 'pread')
+
+class Article:
+    """One news article, stored in slots instead of a per-article dict.
+
+    Supports the dict-style access (article['title'], .get, in) the rest of the code
+    is written against. Keys missing from the source record stay missing in to_dict(),
+    and unknown keys are carried in 'extra', so JSON round-trips unchanged.
+    """
+    FIELDS = ('url', 'title', 'content', 'date', 'published_at', 'author',
+              'scraped_at', 'countries', 'summary', 'is_f1_related')
+    FIELD_BITS = {field: 1 << bit for bit, field in enumerate(FIELDS)}
+
+    __slots__ = ('url', 'title', '_content', 'date', 'published_at', 'author', 'scraped_at',
+                 'countries', 'summary', 'is_f1_related', 'content_source', 'absent', 'extra')
+
+    def __init__(self, **fields: Any):
+        self.url = self.title = self._content = self.date = self.published_at = None
+        self.author = self.scraped_at = self.summary = self.is_f1_related = None
+        self.countries = ()
+        self.content_source = None
+        self.extra = None
+        self.absent = (1 << len(self.FIELDS)) - 1
+        for key, value in fields.items():
+            self[key] = value
+
+    @classmethod
+    def from_dict(cls, record: Dict[str, Any]) -> 'Article':
+        return cls(**record)
+
+    @property
+    def content(self) -> Optional[str]:
+        """Article text; read back from disk if it was released after indexing"""
+        if self._content is None and self.content_source is not None:
+            store, offset, length = self.content_source
+            return store.read(offset, length)
+        return self._content
+
+    @content.setter
+    def content(self, value: Optional[str]):
+        self._content = value
+        self.content_source = None
+
+    def release_content(self, store: ContentStore, offset: int, length: int):
+        """Drop the in-memory text; it is re-read from the given line of the store when needed"""
+        self._content = None
+        self.content_source = (store, offset, length)
+
+    def __getitem__(self, key: str) -> Any:
+        bit = self.FIELD_BITS.get(key)
+        if bit is None:
+            if self.extra is None:
+                raise KeyError(key)
+            return self.extra[key]
+        if self.absent & bit:
+            raise KeyError(key)
+        value = getattr(self, key)
+        return list(value) if key == 'countries' else value
+
+    def __setitem__(self, key: str, value: Any):
+        bit = self.FIELD_BITS.get(key)
+        if bit is None:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+            return
+        self.absent &= ~bit
+        if key == 'countries':
+            value = intern_countries(value)
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        bit = self.FIELD_BITS.get(key)
+        if bit is None:
+            return self.extra is not None and key in self.extra
+        return not self.absent & bit
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> List[str]:
+        keys = [field for field in self.FIELDS if not self.absent & self.FIELD_BITS[field]]
+        return keys + list(self.extra) if self.extra else keys
+
+    def to_dict(self, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """The article in its JSON shape, optionally limited to some fields"""
+        return {key: self[key] for key in (self.keys() if fields is None else fields) if key in self}
+
+    def __repr__(self) -> str:
+        return f"Article(url={self.url!r}, title={self.title!r})"
+
+def json_default(value: Any) -> Any:
+    """json.dump(s) hook that serializes Article records as plain dicts"""
+    if isinstance(value, Article):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
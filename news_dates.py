@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Date Normalization for F1 News
+Parses the date strings found on news pages into ISO timestamps, once, at scrape or load time
+"""
+
+import re
+import threading
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+def format_iso(value: datetime) -> str:
+    """Fixed-width ISO timestamp (seconds precision), so stored values compare correctly as strings"""
+    return value.isoformat(timespec='seconds')
+
+# Pre-classifier: the shape of a date string decides which formats are worth trying
+DATE_SHAPES = [
+    (re.compile(r'^\d{4}-\d{2}-\d{2}([ T]\d{2}:\d{2}(:\d{2}(\.\d+)?)?)?([+-]\d{2}:?\d{2}|Z)?$'), ['iso']),
+    (re.compile(r'^\d{1,2}/\d{1,2}/\d{4}$'), ['%m/%d/%Y', '%d/%m/%Y']),
+    (re.compile(r'^[A-Za-z]+ \d{1,2}, \d{4}$'), ['%B %d, %Y', '%b %d, %Y']),
+    (re.compile(r'^\d{1,2} [A-Za-z]+ \d{4}$'), ['%d %B %Y', '%d %b %Y']),
+    # RSS pubDate: "Thu, 18 Sep 2025 12:00:00 -0400"
+    (re.compile(r'^([A-Za-z]{3}, )?\d{1,2} [A-Za-z]{3} \d{4} \d{2}:\d{2}(:\d{2})?( [+-]\d{4}| [A-Z]{1,3})?$'), ['rfc822']),
+]
+
+# Day and month order is ambiguous for these, so they are always tried in the fixed
+# order above and never cached, or the result would depend on earlier articles
+AMBIGUOUS_FORMATS = {'%m/%d/%Y', '%d/%m/%Y'}
+
+class DateNormalizer:
+    """Parses article dates, remembering which format last worked for each source.
+
+    A source is usually the host of the article URL; pages from one site share a
+    date format, so after the first article the right format is tried first.
+    """
+    def __init__(self):
+        self.source_formats: Dict[str, str] = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def source_of(url: Optional[str]) -> str:
+        return urlparse(url).netloc if url else ''
+
+    def parse(self, date_str: Optional[str], source: str = '') -> Optional[datetime]:
+        """Parse a date string into a naive local datetime, or None"""
+        if not date_str:
+            return None
+        text = ' '.join(date_str.split())
+
+        cached = self.source_formats.get(source)
+        if cached:
+            parsed = self._try(text, cached)
+            if parsed:
+                return parsed
+
+        for pattern, formats in DATE_SHAPES:
+            if pattern.match(text):
+                for fmt in formats:
+                    if fmt == cached:
+                        continue
+                    parsed = self._try(text, fmt)
+                    if parsed:
+                        if fmt not in AMBIGUOUS_FORMATS:
+                            with self.lock:
+                                self.source_formats[source] = fmt
+                        return parsed
+                break
+        return None
+
+    @staticmethod
+    def _try(text: str, fmt: str) -> Optional[datetime]:
+        try:
+            if fmt == 'iso':
+                parsed = datetime.fromisoformat(text.replace('Z', '+00:00'))
+            elif fmt == 'rfc822':
+                parsed = parsedate_to_datetime(text)
+            else:
+                parsed = datetime.strptime(text, fmt)
+        except (TypeError, ValueError):
+            return None
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone().replace(tzinfo=None)
+        return parsed
+
+    def to_iso(self, date_str: Optional[str], source: str = '') -> Optional[str]:
+        """Parse a date string into a fixed-width ISO timestamp, or None"""
+        parsed = self.parse(date_str, source)
+        return format_iso(parsed) if parsed else None
+
+    def annotate(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fill in 'published_at' on articles saved before it was computed at scrape time"""
+        for article in articles:
+            if 'published_at' not in article:
+                article['published_at'] = self.to_iso(article.get('date'), self.source_of(article.get('url')))
+        return articles
+
+# Shared instance so the per-source format cache is reused across callers
+date_normalizer = DateNormalizer()
@@ -5,717 +5,950 @@ Provides a command-line and web interface to search F1 news by country
 """
 
 import json
+import re
+import hashlib
+import bisect
+import gc
+import gzip
+import heapq
+import math
 import pandas as pd
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Tuple
 import argparse
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
+import tempfile
+import threading
 import webbrowser
-from flask import Flask, render_template, request, jsonify
+from collections import OrderedDict
+from flask import Flask, Response, render_template, request, jsonify
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+from country_aliases import CountryResolver
+from news_article import Article, ContentStore, LAZY_CONTENT_SUPPORTED
+from news_dates import date_normalizer, format_iso
+
+TOKEN_RE = re.compile(r"\w+")
+QUERY_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+class InvertedIndex:
+    """Positional inverted index (term -> {article id: positions}) over title, content and summary"""
+    FIELDS = ('title', 'content', 'summary')
+    # Gap between fields so phrases never match across a field boundary
+    FIELD_GAP = 1000
+    # BM25F parameters: per-field boosts and length normalization
+    FIELD_BOOSTS = (3.0, 1.0, 2.0)
+    K1 = 1.2
+    B = 0.75
+    
+    def __init__(self, articles: List[Article]):
+        self.postings: Dict[str, Dict[int, List[int]]] = {}
+        # term -> {article id: [tf in title, tf in content, tf in summary]}
+        self.field_tfs: Dict[str, Dict[int, List[int]]] = {}
+        self.field_lengths: List[List[int]] = []
+        self.doc_count = len(articles)
+        
+        for doc_id, article in enumerate(articles):
+            position = 0
+            lengths = []
+            for field_no, field in enumerate(self.FIELDS):
+                tokens = self.tokenize(getattr(article, field) or '')
+                for token in tokens:
+                    self.postings.setdefault(token, {}).setdefault(doc_id, []).append(position)
+                    tfs = self.field_tfs.setdefault(token, {}).setdefault(doc_id, [0] * len(self.FIELDS))
+                    tfs[field_no] += 1
+                    position += 1
+                lengths.append(len(tokens))
+                position += self.FIELD_GAP
+            self.field_lengths.append(lengths)
+        
+        self.avg_field_lengths = [
+            (sum(lengths[i] for lengths in self.field_lengths) / self.doc_count) or 1.0 if self.doc_count else 1.0
+            for i in range(len(self.FIELDS))
+        ]
+        
+        # Sorted vocabulary for prefix (term*) queries
+        self.vocabulary = sorted(self.postings)
+    
+    @staticmethod
+    def tokenize(text: str) -> List[str]:
+        return TOKEN_RE.findall(text.lower())
+    
+    def expand(self, term: str) -> List[str]:
+        """Expand a trailing-* prefix term into matching vocabulary terms"""
+        if not term.endswith('*'):
+            return [term] if term in self.postings else []
+        prefix = term[:-1]
+        start = bisect.bisect_left(self.vocabulary, prefix)
+        end = bisect.bisect_left(self.vocabulary, prefix + '\uffff')
+        return self.vocabulary[start:end]
+    
+    def term_docs(self, term: str) -> Set[int]:
+        """Article ids containing a term (or any expansion of a prefix term)"""
+        docs = set()
+        for expanded in self.expand(term):
+            docs.update(self.postings[expanded])
+        return docs
+    
+    def phrase_docs(self, terms: List[str]) -> Set[int]:
+        """Article ids where the terms appear consecutively"""
+        if len(terms) == 1:
+            return self.term_docs(terms[0])
+        if any(term not in self.postings for term in terms):
+            return set()
+        
+        # Intersect the shortest posting lists first, then verify positions
+        candidates = set.intersection(*sorted((set(self.postings[t]) for t in terms), key=len))
+        matches = set()
+        for doc_id in candidates:
+            later = [set(self.postings[t][doc_id]) for t in terms[1:]]
+            for start in self.postings[terms[0]][doc_id]:
+                if all(start + offset + 1 in positions for offset, positions in enumerate(later)):
+                    matches.add(doc_id)
+                    break
+        return matches
+    
+    def parse_query(self, query: str) -> List[List[List[str]]]:
+        """Parse a query into OR-groups of AND-ed phrases.
+        
+        Quoted text and words that tokenize to several terms (like "F-1") are
+        phrases; bare words are AND-ed; an uppercase OR separates alternatives.
+        """
+        groups = [[]]
+        for phrase, word in QUERY_RE.findall(query):
+            if word == 'OR':
+                groups.append([])
+                continue
+            if word == 'AND':
+                continue
+            text = phrase if phrase else word
+            terms = self.tokenize(text)
+            if word.endswith('*') and terms:
+                terms[-1] += '*'
+            if terms:
+                groups[-1].append(terms)
+        return [group for group in groups if group]
+    
+    def search(self, query: str) -> List[int]:
+        """Return matching article ids in corpus order"""
+        results = set()
+        for group in self.parse_query(query):
+            group_docs = None
+            # Evaluate the cheapest clauses first so the intersection shrinks fast
+            for terms in sorted(group, key=lambda t: min(len(self.postings.get(term, ())) for term in t)):
+                docs = self.phrase_docs(terms)
+                group_docs = docs if group_docs is None else group_docs & docs
+                if not group_docs:
+                    break
+            results |= group_docs or set()
+        return sorted(results)
+    
+    def score(self, doc_id: int, terms: List[str]) -> float:
+        """BM25F score of an article for the given (expanded) query terms"""
+        lengths = self.field_lengths[doc_id]
+        total = 0.0
+        for term in terms:
+            tfs = self.field_tfs[term].get(doc_id)
+            if not tfs:
+                continue
+            weighted_tf = sum(
+                boost * tf / (1 - self.B + self.B * length / avg_length)
+                for boost, tf, length, avg_length in zip(self.FIELD_BOOSTS, tfs, lengths, self.avg_field_lengths)
+            )
+            df = len(self.postings[term])
+            idf = math.log(1 + (self.doc_count - df + 0.5) / (df + 0.5))
+            total += idf * weighted_tf / (self.K1 + weighted_tf)
+        return total
+    
+    def rank(self, query: str, limit: Optional[int] = 10, offset: int = 0) -> Tuple[int, List[Tuple[int, float]]]:
+        """Return (total matches, [(article id, score)]) for one page of the best-scoring matches"""
+        matches = self.search(query)
+        terms = {
+            expanded
+            for group in self.parse_query(query)
+            for phrase in group
+            for term in phrase
+            for expanded in self.expand(term)
+        }
+        terms = list(terms)
+        scored = ((self.score(doc_id, terms), doc_id) for doc_id in matches)
+        
+        if limit is None:
+            ranked = sorted(scored, key=lambda item: (-item[0], item[1]))[offset:]
+        else:
+            # Only keep the top offset+limit scores in a heap; ties keep corpus order
+            ranked = heapq.nsmallest(offset + limit, scored, key=lambda item: (-item[0], item[1]))[offset:]
+        return len(matches), [(doc_id, score) for score, doc_id in ranked]
+
+class DateIndex:
+    """Article ids sorted by published_at, for O(log n + k) time-window queries"""
+    def __init__(self, articles: List[Article]):
+        entries = sorted(
+            (article.published_at, doc_id)
+            for doc_id, article in enumerate(articles)
+            if article.published_at
+        )
+        self.dates = [published_at for published_at, _ in entries]
+        self.ids = [doc_id for _, doc_id in entries]
+    
+    def range(self, since: Optional[str] = None, until: Optional[str] = None) -> List[int]:
+        """Ids of articles published in [since, until], newest first.
+        
+        Bounds are ISO strings; a date-only until ('2025-09-18') covers that whole day.
+        """
+        lo = bisect.bisect_left(self.dates, since) if since else 0
+        hi = bisect.bisect_right(self.dates, until + '\uffff') if until else len(self.dates)
+        return self.ids[lo:hi][::-1]
+
+class SearchSnapshot:
+    """Immutable bundle of everything a query reads, built completely before it is published"""
+    def __init__(self, f1_news: List[Article], country_db: Dict[str, List[int]],
+                 index: InvertedIndex, data_file: Optional[str] = None, version: int = 0):
+        self.f1_news = f1_news
+        self.country_db = country_db
+        self.index = index
+        self.date_index = DateIndex(f1_news)
+        self.country_resolver = CountryResolver(country_db)
+        self.data_file = data_file
+        self.version = version
+
+def file_signature(path: str) -> Optional[Tuple[str, int, int]]:
+    """(path, mtime, size) of a file, or None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+ARCHIVE_FILE = 'f1_archive.jsonl'
+ARCHIVE_FORMAT = 'f1_news_archive'
+
+def is_snapshot_file(filename: str) -> bool:
+    """Flat article snapshots written by the scraper (by-country files are derived from them)"""
+    return (filename.startswith('f1_news_') and filename.endswith(('.json', '.jsonl'))
+            and not filename.startswith('f1_news_by_country_'))
+
+def iter_articles(data_file: str):
+    """Yield articles from a JSON array, a legacy archive or a JSON Lines file.
+    
+    JSON Lines files are streamed one line at a time, so memory stays flat and the
+    first article is available immediately. A header line carrying a 'format' key
+    is skipped, and so is a truncated last line from a writer that is still appending.
+    """
+    if data_file.endswith('.jsonl'):
+        with open(data_file, 'rb') as f:
+            for _, _, record in iter_jsonl_records(f):
+                yield record
+        return
+    
+    with open(data_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict) and data.get('format') == ARCHIVE_FORMAT:
+        data = data['articles']
+    yield from data
+
+def iter_jsonl_records(f):
+    """Yield (offset, length, article) for each article line of a JSON Lines file opened in binary mode"""
+    offset = 0
+    for line in f:
+        length = len(line)
+        if line.strip():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                if line.endswith(b'\n'):
+                    raise
+                break
+            if 'format' not in record:
+                yield offset, length, record
+        offset += length
+
+def load_articles(data_file: str, lazy_content: bool = LAZY_CONTENT_SUPPORTED) -> Tuple[List[Article], InvertedIndex]:
+    """Read a data file into Article records and index them.
+    
+    With lazy_content, the text of JSON Lines articles is released once it has been
+    indexed and read back from the file only when a response asks for it.
+    """
+    if not (lazy_content and data_file.endswith('.jsonl')):
+        f1_news = [Article.from_dict(record) for record in iter_articles(data_file)]
+        return date_normalizer.annotate(f1_news), InvertedIndex(f1_news)
+    
+    # Offsets are taken from the store's own handle, so they match what it reads later
+    store = ContentStore(data_file)
+    locations = []
+    f1_news = []
+    for offset, length, record in iter_jsonl_records(store.file):
+        f1_news.append(Article.from_dict(record))
+        locations.append((offset, length))
+    date_normalizer.annotate(f1_news)
+    index = InvertedIndex(f1_news)
+    
+    for article, (offset, length) in zip(f1_news, locations):
+        article.release_content(store, offset, length)
+    return f1_news, index
+
+def read_jsonl_header(data_file: str) -> Optional[Dict[str, Any]]:
+    """Return the header record of a JSON Lines archive, if it has one"""
+    with open(data_file, 'r', encoding='utf-8') as f:
+        record = json.loads(f.readline() or 'null')
+    return record if isinstance(record, dict) and record.get('format') else None
+
+def article_key(article: Dict[str, Any]) -> str:
+    """Identity of an article: its URL, or a content hash when there is none"""
+    return article.get('url') or 'sha256:' + content_hash(article)
+
+def content_hash(article: Dict[str, Any]) -> str:
+    text = f"{article.get('title', '')}\0{article.get('content', '')}"
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+def merge_articles(merged: Dict[str, Dict[str, Any]], articles):
+    """Merge articles into a key -> article map, keeping the most recently scraped version"""
+    for article in articles:
+        key = article_key(article)
+        existing = merged.get(key)
+        if existing is None or (article.get('scraped_at') or '') >= (existing.get('scraped_at') or ''):
+            merged[key] = article
+
+def dedupe_articles(merged: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Collapse identical content published under different URLs; newest first"""
+    by_hash = {}
+    for article in merged.values():
+        digest = content_hash(article)
+        existing = by_hash.get(digest)
+        if existing is None or (article.get('scraped_at') or '') > (existing.get('scraped_at') or ''):
+            by_hash[digest] = article
+    return sorted(by_hash.values(), key=lambda a: a.get('scraped_at') or '', reverse=True)
+
+def load_archive_header(archive_path: str) -> Dict[str, Any]:
+    """Read the header line of an archive, or return an empty header"""
+    try:
+        header = read_jsonl_header(archive_path)
+        if header and header.get('format') == ARCHIVE_FORMAT:
+            return header
+    except (OSError, ValueError):
+        pass
+    return {'format': ARCHIVE_FORMAT, 'version': 1, 'sources': {}}
+
+# Serializes archive merges between threads; the lock file serializes them between processes
+archive_lock = threading.Lock()
+
+def update_archive(directory: str = '.', archive_file: str = ARCHIVE_FILE) -> Optional[str]:
+    """Merge every f1_news_*.json snapshot into one deduplicated archive file.
+    
+    The archive records the (mtime, size) of each source it has absorbed, so only
+    new or modified snapshots are read; with nothing new, this is a directory
+    listing plus a stat per file. Returns the archive path, or None if there is no data.
+    """
+    with archive_lock:
+        if fcntl is None:
+            return merge_into_archive(directory, archive_file)
+        with open(os.path.join(directory, archive_file + '.lock'), 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            return merge_into_archive(directory, archive_file)
+
+def merge_into_archive(directory: str, archive_file: str) -> Optional[str]:
+    """The unlocked body of update_archive"""
+    archive_path = os.path.join(directory, archive_file)
+    snapshot_files = sorted(f for f in os.listdir(directory) if is_snapshot_file(f))
+    if not snapshot_files and not os.path.exists(archive_path):
+        return None
+    
+    header = load_archive_header(archive_path)
+    sources = header['sources']
+    changed = []
+    for filename in snapshot_files:
+        stat = os.stat(os.path.join(directory, filename))
+        if sources.get(filename) != [stat.st_mtime_ns, stat.st_size]:
+            changed.append((stat.st_mtime_ns, filename, [stat.st_mtime_ns, stat.st_size]))
+    
+    if not changed and os.path.exists(archive_path):
+        return archive_path
+    
+    merged = {}
+    if sources and os.path.exists(archive_path):
+        merge_articles(merged, iter_articles(archive_path))
+    # Oldest files first, so a later snapshot wins ties on scraped_at
+    for _, filename, signature in sorted(changed):
+        try:
+            articles = list(iter_articles(os.path.join(directory, filename)))
+        except (OSError, ValueError, TypeError) as e:
+            print(f"Skipping unreadable snapshot {filename}: {str(e)}")
+            continue
+        merge_articles(merged, (a for a in articles if isinstance(a, dict)))
+        sources[filename] = signature
+    
+    articles = date_normalizer.annotate(dedupe_articles(merged))
+    # A private temp file per writer, so a half-written archive is never installed
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=archive_file + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(header, separators=(',', ':')) + '\n')
+            for article in articles:
+                f.write(json.dumps(article, ensure_ascii=False, separators=(',', ':')) + '\n')
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, archive_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    print(f"Merged {len(changed)} snapshot file(s) into {archive_path} ({len(articles)} articles)")
+    return archive_path
+
+class DataFileWatcher(threading.Thread):
+    """Polls the data file (mtime/size) and hot-swaps a freshly built snapshot into the searcher"""
+    def __init__(self, searcher: 'F1NewsSearcher', resolve_path=None, interval: float = 5.0):
+        super().__init__(daemon=True)
+        self.searcher = searcher
+        # Called on every poll, so a newly written snapshot file is picked up too
+        self.resolve_path = resolve_path or (lambda: searcher.data_file)
+        self.interval = interval
+        self.failed_signature = None
+        self.stop_event = threading.Event()
+    
+    def check(self) -> bool:
+        """Reload if the data file changed since the last successful load"""
+        path = self.resolve_path()
+        if not path:
+            return False
+        signature = file_signature(path)
+        if signature is None or signature in (self.searcher.loaded_signature, self.failed_signature):
+            return False
+        print(f"Data file changed, reloading {path}")
+        if self.searcher.load_data(path):
+            return True
+        # A half-written file is retried once its mtime or size changes again
+        self.failed_signature = signature
+        return False
+    
+    def run(self):
+        while not self.stop_event.wait(self.interval):
+            try:
+                self.check()
+            except Exception as e:
+                print(f"Error watching data file: {str(e)}")
+    
+    def stop(self):
+        self.stop_event.set()
 
 class F1NewsSearcher:
     def __init__(self, data_file: str = None):
         self.data_file = data_file
-        self.f1_news = []
-        self.country_db = {}
+        self.snapshot = SearchSnapshot([], {}, InvertedIndex([]))
+        self.loaded_signature = None
+        self.reload_lock = threading.Lock()
+        self.watcher = None
         
         if data_file and os.path.exists(data_file):
             self.load_data(data_file)
     
-    def load_data(self, data_file: str):
-        """Load F1 news data from JSON file"""
-        try:
-            with open(data_file, 'r', encoding='utf-8') as f:
-                self.f1_news = json.load(f)
-            
-            # Recreate country database
-            self.country_db = self.create_country_database()
-            print(f"Loaded {len(self.f1_news)} F1 news articles")
-            
-        except Exception as e:
-            print(f"Error loading data: {str(e)}")
-    
-    def create_country_database(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Create searchable database by country"""
+    # Readers grab self.snapshot once per call; a reload replaces it with a single
+    # reference assignment, so queries never block and never see a half-built index.
+    @property
+    def f1_news(self) -> List[Article]:
+        return self.snapshot.f1_news
+    
+    @property
+    def country_db(self) -> Dict[str, List[int]]:
+        """Country name -> ids (positions in f1_news) of the articles that mention it"""
+        return self.snapshot.country_db
+    
+    @property
+    def index(self) -> InvertedIndex:
+        return self.snapshot.index
+    
+    def load_data(self, data_file: str) -> bool:
+        """Load F1 news data from a JSON or JSON Lines file"""
+        with self.reload_lock:
+            try:
+                signature = file_signature(data_file)
+                f1_news, index = load_articles(data_file)
+                
+                # Build country database and keyword index off to the side, then swap
+                snapshot = SearchSnapshot(
+                    f1_news,
+                    self.create_country_database(f1_news),
+                    index,
+                    data_file,
+                    self.snapshot.version + 1
+                )
+                self.snapshot = snapshot
+                self.data_file = data_file
+                self.loaded_signature = signature
+                print(f"Loaded {len(f1_news)} F1 news articles")
+                return True
+                
+            except Exception as e:
+                print(f"Error loading data: {str(e)}")
+                return False
+    
+    def start_watching(self, interval: float = 5.0, resolve_path=None) -> DataFileWatcher:
+        """Start a background thread that reloads the data when the file changes"""
+        if self.watcher is None:
+            self.watcher = DataFileWatcher(self, resolve_path, interval)
+            self.watcher.start()
+        return self.watcher
+    
+    def create_country_database(self, f1_news: Optional[List[Article]] = None) -> Dict[str, List[int]]:
+        """Create searchable database by country (country -> article ids)"""
         country_db = {}
         
-        for article in self.f1_news:
-            for country in article.get('countries', []):
+        for article_id, article in enumerate(self.f1_news if f1_news is None else f1_news):
+            for country in article.countries:
                 if country not in country_db:
                     country_db[country] = []
-                country_db[country].append(article)
+                country_db[country].append(article_id)
         
         return country_db
     
-    def search_by_country(self, country: str) -> List[Dict[str, Any]]:
-        """Search news by country"""
-        country_lower = country.lower()
+    def search_by_country(self, country: str, snapshot: Optional[SearchSnapshot] = None) -> List[Article]:
+        """Search news by country name, ISO code, demonym or alias (typos fall back to fuzzy matching)"""
+        snapshot = snapshot or self.snapshot
+        names = snapshot.country_resolver.resolve(country)
         
-        # Try exact match first
-        if country_lower.title() in self.country_db:
-            return self.country_db[country_lower.title()]
+        if len(names) == 1:
+            return [snapshot.f1_news[i] for i in snapshot.country_db[names[0]]]
         
-        # Try case-insensitive match
-        results = []
-        for db_country, articles in self.country_db.items():
-            if country_lower in db_country.lower():
-                results.extend(articles)
+        # Several data names for one country (e.g. "Ivory Coast" and "Cote D'Ivoire")
+        article_ids = set()
+        for name in names:
+            article_ids.update(snapshot.country_db[name])
         
-        return results
+        return [snapshot.f1_news[i] for i in sorted(article_ids)]
     
-    def search_by_keyword(self, keyword: str) -> List[Dict[str, Any]]:
-        """Search news by keyword"""
-        keyword_lower = keyword.lower()
-        results = []
-        
-        for article in self.f1_news:
-            full_text = f"{article['title']} {article['content']} {article.get('summary', '')}"
-            if keyword_lower in full_text.lower():
-                results.append(article)
-        
-        return results
+    def search_by_keyword(self, keyword: str, limit: Optional[int] = None, offset: int = 0) -> List[Article]:
+        """Search news by keyword, "phrase", AND/OR terms or prefix* terms, best matches first"""
+        return self.rank_by_keyword(keyword, limit, offset)[1]
+    
+    def rank_by_keyword(self, keyword: str, limit: Optional[int] = 10, offset: int = 0,
+                        snapshot: Optional[SearchSnapshot] = None) -> Tuple[int, List[Article]]:
+        """Return the total number of matches and one BM25-ranked page of articles"""
+        snapshot = snapshot or self.snapshot
+        total, ranked = snapshot.index.rank(keyword, limit, offset)
+        return total, [snapshot.f1_news[doc_id] for doc_id, _ in ranked]
     
     def get_all_countries(self) -> List[str]:
         """Get list of all countries with F1 news"""
         return sorted(list(self.country_db.keys()))
     
-    def get_recent_news(self, days: int = 30) -> List[Dict[str, Any]]:
-        """Get recent news within specified days"""
-        from datetime import datetime, timedelta
-        
-        cutoff_date = datetime.now() - timedelta(days=days)
-        recent_news = []
-        
-        for article in self.f1_news:
-            try:
-                if article.get('date'):
-                    # Try to parse date
-                    article_date = datetime.strptime(article['date'], '%Y-%m-%d')
-                    if article_date >= cutoff_date:
-                        recent_news.append(article)
-            except:
-                # If date parsing fails, include the article
-                recent_news.append(article)
-        
-        return recent_news
+    def get_recent_news(self, days: int = 30) -> List[Article]:
+        """Get recent news within specified days, newest first (undated articles are excluded)"""
+        return self.get_news_in_range(days=days, limit=None)[1]
+    
+    def get_news_in_range(self, since: Optional[str] = None, until: Optional[str] = None,
+                          days: Optional[int] = None, country: Optional[str] = None,
+                          keyword: Optional[str] = None, limit: Optional[int] = 10,
+                          offset: int = 0) -> Tuple[int, List[Article]]:
+        """Articles published in a time window, newest first, optionally filtered by country or keyword.
+        
+        since/until are ISO dates or timestamps; days means "the last N days" and
+        overrides since. Returns the total number of matches and one page.
+        """
+        snapshot = self.snapshot
+        if days is not None:
+            since = format_iso(datetime.now() - timedelta(days=days))
+        article_ids = snapshot.date_index.range(since, until)
+        
+        if country is not None:
+            allowed = set()
+            for name in snapshot.country_resolver.resolve(country):
+                allowed.update(snapshot.country_db[name])
+            article_ids = [doc_id for doc_id in article_ids if doc_id in allowed]
+        if keyword:
+            matches = set(snapshot.index.search(keyword))
+            article_ids = [doc_id for doc_id in article_ids if doc_id in matches]
+        
+        page = article_ids[offset:] if limit is None else article_ids[offset:offset + limit]
+        return len(article_ids), [snapshot.f1_news[doc_id] for doc_id in page]
     
-    def display_results(self, results: List[Dict[str, Any]], limit: int = 10):
+    def display_results(self, results: List[Article], limit: int = 10,
+                        total: Optional[int] = None, offset: int = 0):
         """Display search results in a formatted way"""
         if not results:
             print("No results found.")
             return
         
-        print(f"\nFound {len(results)} results:")
+        print(f"\nFound {total if total is not None else len(results)} results:")
         print("=" * 80)
         
         for i, article in enumerate(results[:limit]):
-            print(f"\n{i+1}. {article['title']}")
+            print(f"\n{offset+i+1}. {article['title']}")
             print(f"   URL: {article['url']}")
             print(f"   Date: {article.get('date', 'Unknown')}")
             print(f"   Countries: {', '.join(article.get('countries', []))}")
             print(f"   Summary: {article.get('summary', 'No summary available')[:200]}...")
             print("-" * 80)
 
-def create_web_interface(searcher: F1NewsSearcher):
+# Bodies smaller than this are not worth compressing
+COMPRESS_MIN_BYTES = 1024
+
+def encode_variants(body: bytes) -> Dict[str, bytes]:
+    """Content-Encoding -> body: the plain body plus gzip (and brotli, if installed) variants"""
+    variants = {'identity': body}
+    if len(body) >= COMPRESS_MIN_BYTES:
+        variants['gzip'] = gzip.compress(body, 6)
+        if brotli is not None:
+            variants['br'] = brotli.compress(body)
+    return variants
+
+def choose_encoding(accept_encodings, variants: Dict[str, bytes]) -> str:
+    """Pick the best variant the client accepts"""
+    for encoding in ('br', 'gzip'):
+        if encoding in variants and accept_encodings[encoding]:
+            return encoding
+    return 'identity'
+
+class ResponseCache:
+    """LRU cache of encoded response bodies (with compressed variants) and their ETags, bounded by total bytes.
+    
+    Entries belong to one data version; the first lookup after a reload clears them.
+    """
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> (variants, etag), least recently used first
+        self.total_bytes = 0
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.lock = threading.Lock()
+    
+    def _check_version(self, version: int):
+        if version != self.version:
+            if self.entries:
+                self.invalidations += 1
+            self.entries.clear()
+            self.total_bytes = 0
+            self.version = version
+    
+    def get(self, version: int, key: Any) -> Optional[Tuple[Dict[str, bytes], str]]:
+        """Return (variants, etag) for a key, or None on a miss"""
+        with self.lock:
+            self._check_version(version)
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry
+    
+    def put(self, version: int, key: Any, body: bytes) -> Tuple[Dict[str, bytes], str]:
+        """Compress and store an encoded body, returning (variants, etag)"""
+        variants = encode_variants(body)
+        entry = (variants, hashlib.blake2b(body, digest_size=12).hexdigest())
+        size = sum(len(variant) for variant in variants.values())
+        if size > self.max_bytes:
+            return entry
+        with self.lock:
+            self._check_version(version)
+            old = self.entries.pop(key, None)
+            if old:
+                self.total_bytes -= sum(len(variant) for variant in old[0].values())
+            self.entries[key] = entry
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                _, (evicted, _) = self.entries.popitem(last=False)
+                self.total_bytes -= sum(len(variant) for variant in evicted.values())
+                self.evictions += 1
+        return entry
+    
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'entries': len(self.entries),
+                'bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+                'data_version': self.version
+            }
+
+def parse_page_args(args, default_limit: int = 20, max_limit: int = 100) -> Tuple[int, int]:
+    """Read limit/offset query parameters, clamped to sane bounds"""
+    try:
+        limit = int(args.get('limit', default_limit))
+    except ValueError:
+        limit = default_limit
+    try:
+        offset = int(args.get('offset', 0))
+    except ValueError:
+        offset = 0
+    return min(max(limit, 1), max_limit), max(offset, 0)
+
+# Articles rendered into the landing page; the rest are fetched from /feed on scroll
+FEED_PAGE_SIZE = 20
+
+# What the page renders; 'content' (the full article text) is only sent when asked for
+DEFAULT_FIELDS = ('title', 'date', 'published_at', 'url', 'countries', 'summary')
+
+def parse_fields_arg(args) -> Optional[Tuple[str, ...]]:
+    """Read the fields= projection parameter; None means whole articles (fields=all)"""
+    value = args.get('fields', '').strip()
+    if not value:
+        return DEFAULT_FIELDS
+    if value in ('all', '*'):
+        return None
+    return tuple(sorted(set(field.strip() for field in value.split(',') if field.strip()))) or DEFAULT_FIELDS
+
+def project_articles(articles: List[Article], fields: Optional[Tuple[str, ...]]) -> List[Dict[str, Any]]:
+    """Serialize articles, keeping only the requested fields (None keeps all, content included)"""
+    return [article.to_dict(fields) for article in articles]
+
+def page_response(results: List[Article], total: int, limit: int, offset: int,
+                  fields: Optional[Tuple[str, ...]]) -> Dict[str, Any]:
+    """Build a paginated JSON payload; next_offset is None on the last page"""
+    return {
+        'results': project_articles(results, fields),
+        'total': total,
+        'limit': limit,
+        'offset': offset,
+        'next_offset': offset + limit if offset + limit < total else None
+    }
+
+def create_web_interface(searcher: F1NewsSearcher, cache_max_bytes: int = 32 * 1024 * 1024):
     """Create Flask web interface for searching"""
     app = Flask(__name__)
+    response_cache = ResponseCache(cache_max_bytes)
+    app.extensions['response_cache'] = response_cache
+    
+    # Parse and compile the template once at startup rather than on the first request
+    app.jinja_env.get_template('index.html')
+    
+    def cached_response(key: Any, build, mimetype: str, snapshot: Optional[SearchSnapshot] = None) -> Response:
+        """Serve a pre-encoded body for a normalized key, building it (once per data version) on a miss.
+        
+        Pass the snapshot the key was normalized against, so a concurrent reload
+        cannot file one version's results under another version.
+        """
+        snapshot = snapshot or searcher.snapshot
+        entry = response_cache.get(snapshot.version, key)
+        if entry is None:
+            entry = response_cache.put(snapshot.version, key, build(snapshot))
+        variants, etag = entry
+        encoding = choose_encoding(request.accept_encodings, variants)
+        response = Response(variants[encoding], mimetype=mimetype)
+        if encoding != 'identity':
+            response.headers['Content-Encoding'] = encoding
+            etag = f"{etag}-{encoding}"
+        response.set_etag(etag)
+        response.vary.add('Accept-Encoding')
+        response.headers['Cache-Control'] = 'no-cache'
+        return response.make_conditional(request)
+    
+    def cached_json(key: Any, build, snapshot: Optional[SearchSnapshot] = None) -> Response:
+        """Serve pre-encoded compact JSON for a normalized key, building it on a miss"""
+        def encode(snapshot: SearchSnapshot) -> bytes:
+            return app.json.dumps(build(snapshot), separators=(',', ':')).encode('utf-8')
+        
+        return cached_response(key, encode, 'application/json', snapshot)
     
     @app.route('/')
     def index():
-        countries = searcher.get_all_countries()
-        all_today_news = searcher.f1_news  # Get all today's news
-        return render_template('index.html', countries=countries, all_today_news=all_today_news)
+        # The landing page only changes with the data, so it is rendered once per version
+        def build(snapshot: SearchSnapshot) -> bytes:
+            countries = sorted(snapshot.country_db.keys())
+            total = len(snapshot.f1_news)
+            first_page = snapshot.f1_news[:FEED_PAGE_SIZE]
+            return render_template('index.html', countries=countries, all_today_news=first_page, total_news=total,
+                                   next_offset=FEED_PAGE_SIZE if FEED_PAGE_SIZE < total else None).encode('utf-8')
+        
+        return cached_response(('index',), build, 'text/html')
     
     @app.route('/search')
     def search():
         query = request.args.get('q', '')
         country = request.args.get('country', '')
+        limit, offset = parse_page_args(request.args)
+        fields = parse_fields_arg(request.args)
+        snapshot = searcher.snapshot
         
-        results = []
+        # Normalize the key so "india", "India", "IN" and "Indian" share one entry
         if country:
-            results = searcher.search_by_country(country)
+            key = ('country', snapshot.country_resolver.canonical(country) or '', limit, offset, fields)
         elif query:
-            results = searcher.search_by_keyword(query)
+            key = ('keyword', repr(snapshot.index.parse_query(query)), limit, offset, fields)
+        else:
+            key = ('empty', limit, offset, fields)
+        
+        def build(snapshot: SearchSnapshot) -> Dict[str, Any]:
+            results = []
+            total = 0
+            if country:
+                matches = searcher.search_by_country(country, snapshot)
+                total = len(matches)
+                results = matches[offset:offset + limit]
+            elif query:
+                total, results = searcher.rank_by_keyword(query, limit, offset, snapshot)
+            return page_response(results, total, limit, offset, fields)
+        
+        return cached_json(key, build, snapshot)
+    
+    @app.route('/feed')
+    def feed():
+        limit, offset = parse_page_args(request.args, default_limit=FEED_PAGE_SIZE)
+        fields = parse_fields_arg(request.args)
         
-        return jsonify({
-            'results': results,
-            'total': len(results)
-        })
+        def build(snapshot: SearchSnapshot) -> Dict[str, Any]:
+            total = len(snapshot.f1_news)
+            return page_response(snapshot.f1_news[offset:offset + limit], total, limit, offset, fields)
+        
+        return cached_json(('feed', limit, offset, fields), build)
+    
+    @app.route('/recent')
+    def recent():
+        limit, offset = parse_page_args(request.args)
+        try:
+            days = int(request.args['days']) if request.args.get('days') else None
+        except ValueError:
+            return jsonify({'error': 'days must be an integer'}), 400
+        
+        total, results = searcher.get_news_in_range(
+            since=request.args.get('since') or None,
+            until=request.args.get('until') or None,
+            days=days,
+            country=request.args.get('country') or None,
+            keyword=request.args.get('q') or None,
+            limit=limit,
+            offset=offset
+        )
+        return jsonify(page_response(results, total, limit, offset, parse_fields_arg(request.args)))
     
     @app.route('/countries')
     def countries():
-        return jsonify(searcher.get_all_countries())
+        return cached_json(('countries',), lambda snapshot: sorted(snapshot.country_db.keys()))
+    
+    @app.route('/metrics/cache')
+    def cache_metrics():
+        return jsonify(response_cache.stats())
     
     return app
 
+def serve_production(searcher: F1NewsSearcher, bind: str = '127.0.0.1:5003', workers: int = 2, threads: int = 4,
+                     cache_max_bytes: int = 32 * 1024 * 1024, watch_interval: Optional[float] = None,
+                     resolve_path=None) -> bool:
+    """Serve the web interface with gunicorn (pre-fork workers x threads).
+    
+    The data is loaded once in the master and inherited copy-on-write by the workers.
+    SIGHUP reloads the data in the master and replaces the workers gracefully;
+    SIGTERM drains in-flight requests before exiting. With a resolve_path (the
+    archive merge), only the master runs it; workers just follow the data file.
+    """
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        print("Production serving requires gunicorn: pip install gunicorn")
+        return False
+    
+    app = create_web_interface(searcher, cache_max_bytes)
+    
+    def on_reload(arbiter):
+        # Runs in the master before the new generation of workers is forked
+        path = resolve_path() if resolve_path else searcher.data_file
+        if path:
+            searcher.load_data(path)
+        gc.freeze()
+    
+    def when_ready(server):
+        # Merge new snapshots in the master only, so workers never race on the archive file
+        if watch_interval and resolve_path:
+            threading.Thread(target=merge_snapshots, daemon=True).start()
+    
+    def merge_snapshots():
+        # Workers pick up the rewritten archive through their own file watchers
+        idle = threading.Event()
+        while not idle.wait(watch_interval):
+            try:
+                resolve_path()
+            except Exception as e:
+                print(f"Error merging snapshots: {str(e)}")
+    
+    def post_fork(server, worker):
+        # Threads do not survive fork, so each worker polls the data file itself
+        if watch_interval:
+            searcher.watcher = None
+            searcher.start_watching(watch_interval)
+    
+    class SearchApplication(BaseApplication):
+        def load_config(self):
+            options = {
+                'bind': bind,
+                'workers': workers,
+                'threads': threads,
+                'worker_class': 'gthread' if threads > 1 else 'sync',
+                'preload_app': True,
+                'graceful_timeout': 30,
+                'on_reload': on_reload,
+                'when_ready': when_ready,
+                'post_fork': post_fork
+            }
+            for key, value in options.items():
+                self.cfg.set(key, value)
+        
+        def load(self):
+            return app
+    
+    # Move the loaded articles and indexes out of the collector's reach so that
+    # gc passes in the workers do not write to (and un-share) their pages
+    gc.freeze()
+    print(f"Serving on http://{bind} with {workers} worker(s) x {threads} thread(s)")
+    SearchApplication().run()
+    return True
+
 def main():
     parser = argparse.ArgumentParser(description='F1 News Searcher')
-    parser.add_argument('--data', help='Path to F1 news JSON file')
+    parser.add_argument('--data', help='Path to F1 news JSON or JSON Lines file (default: merged archive of all snapshots)')
     parser.add_argument('--country', help='Search by country')
     parser.add_argument('--keyword', help='Search by keyword')
     parser.add_argument('--web', action='store_true', help='Start web interface')
-    parser.add_argument('--recent', type=int, help='Show recent news (days)')
+    parser.add_argument('--recent', type=int, help='Show recent news (days); combine with --country or --keyword')
+    parser.add_argument('--since', help='Show news published on or after this date (YYYY-MM-DD)')
+    parser.add_argument('--until', help='Show news published on or before this date (YYYY-MM-DD)')
     parser.add_argument('--list-countries', action='store_true', help='List all countries')
+    parser.add_argument('--limit', type=int, default=10, help='Number of results to show')
+    parser.add_argument('--offset', type=int, default=0, help='Number of results to skip')
+    parser.add_argument('--watch', action='store_true', help='With --web or --serve, reload data when the data file changes')
+    parser.add_argument('--watch-interval', type=float, default=5.0, help='Seconds between data file checks')
+    parser.add_argument('--serve', action='store_true', help='Serve the web interface with a production WSGI server (gunicorn)')
+    parser.add_argument('--bind', default='127.0.0.1:5003', help='With --serve, address to listen on (host:port)')
+    parser.add_argument('--workers', type=int, default=2, help='With --serve, number of worker processes')
+    parser.add_argument('--threads', type=int, default=4, help='With --serve, threads per worker')
+    parser.add_argument('--response-cache-mb', type=int, default=32, help='Size limit of the web response cache in MB')
     
     args = parser.parse_args()
     
-    # Find the most recent data file if not specified
+    # Merge all snapshots into the archive if no data file is specified
+    follow_latest = not args.data
     if not args.data:
-        json_files = [f for f in os.listdir('.') if f.startswith('f1_news_') and f.endswith('.json')]
-        if json_files:
-            args.data = sorted(json_files)[-1]  # Get most recent file
-        else:
+        args.data = update_archive()
+        if not args.data:
             print("No F1 news data file found. Please run the scraper first.")
             return
     
     searcher = F1NewsSearcher(args.data)
     
-    if args.web:
-        # Create HTML template
-        os.makedirs('templates', exist_ok=True)
-        
-        html_template = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>F1 Student News Search</title>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body { 
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
-            background-color: #000; 
-            color: #fff; 
-            min-height: 100vh;
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            justify-content: center;
-            padding: 20px;
-        }
-        
-        .header {
-            text-align: center;
-            margin-bottom: 50px;
-        }
-        
-        .header h1 {
-            font-size: 3rem;
-            font-weight: 300;
-            color: #00ff88;
-            margin-bottom: 10px;
-            text-shadow: 0 0 20px rgba(0, 255, 136, 0.3);
-        }
-        
-        .header p {
-            font-size: 1.2rem;
-            color: #ccc;
-            opacity: 0.8;
-        }
-        
-        .chat-bubble {
-            background: linear-gradient(135deg, #1a1a1a, #2a2a2a);
-            border: 2px solid #00ff88;
-            border-radius: 25px;
-            padding: 30px 40px;
-            max-width: 600px;
-            width: 100%;
-            box-shadow: 0 10px 30px rgba(0, 255, 136, 0.1);
-            position: relative;
-            margin-bottom: 30px;
-        }
-        
-        .chat-bubble::before {
-            content: '';
-            position: absolute;
-            bottom: -15px;
-            left: 50%;
-            transform: translateX(-50%);
-            width: 0;
-            height: 0;
-            border-left: 15px solid transparent;
-            border-right: 15px solid transparent;
-            border-top: 15px solid #00ff88;
-        }
-        
-        .chat-bubble h2 {
-            color: #00ff88;
-            font-size: 1.5rem;
-            margin-bottom: 20px;
-            text-align: center;
-        }
-        
-        .country-input {
-            width: 100%;
-            padding: 15px 20px;
-            background: #333;
-            border: 2px solid #555;
-            border-radius: 15px;
-            color: #fff;
-            font-size: 1.1rem;
-            outline: none;
-            transition: all 0.3s ease;
-        }
-        
-        .country-input:focus {
-            border-color: #00ff88;
-            box-shadow: 0 0 15px rgba(0, 255, 136, 0.2);
-        }
-        
-        .country-input::placeholder {
-            color: #888;
-        }
-        
-        .search-btn {
-            width: 100%;
-            padding: 15px;
-            background: linear-gradient(135deg, #00ff88, #00cc6a);
-            border: none;
-            border-radius: 15px;
-            color: #000;
-            font-size: 1.1rem;
-            font-weight: bold;
-            cursor: pointer;
-            margin-top: 20px;
-            transition: all 0.3s ease;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        }
-        
-        .search-btn:hover {
-            background: linear-gradient(135deg, #00cc6a, #00aa55);
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(0, 255, 136, 0.3);
-        }
-        
-        .results {
-            width: 100%;
-            max-width: 800px;
-            margin-top: 30px;
-        }
-        
-        .result-item {
-            background: linear-gradient(135deg, #1a1a1a, #2a2a2a);
-            border: 1px solid #333;
-            border-radius: 15px;
-            padding: 25px;
-            margin-bottom: 20px;
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3);
-            transition: all 0.3s ease;
-        }
-        
-        .result-item:hover {
-            border-color: #00ff88;
-            transform: translateY(-2px);
-            box-shadow: 0 8px 25px rgba(0, 255, 136, 0.1);
-        }
-        
-        .result-title {
-            font-size: 1.3rem;
-            font-weight: bold;
-            color: #00ff88;
-            margin-bottom: 15px;
-            line-height: 1.4;
-        }
-        
-        .result-meta {
-            color: #aaa;
-            margin-bottom: 15px;
-            font-size: 0.9rem;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            flex-wrap: wrap;
-            gap: 10px;
-        }
-        
-        .result-date {
-            color: #00ff88;
-            font-weight: bold;
-            background: rgba(0, 255, 136, 0.1);
-            padding: 3px 8px;
-            border-radius: 8px;
-            border: 1px solid #00ff88;
-        }
-        
-        .result-meta a {
-            color: #00ff88;
-            text-decoration: none;
-        }
-        
-        .result-meta a:hover {
-            text-decoration: underline;
-        }
-        
-        .countries-list {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 8px;
-            margin-bottom: 15px;
-        }
-        
-        .country-tag {
-            background: linear-gradient(135deg, #00ff88, #00cc6a);
-            color: #000;
-            padding: 5px 12px;
-            border-radius: 20px;
-            font-size: 0.8rem;
-            font-weight: bold;
-        }
-        
-        .result-summary {
-            line-height: 1.6;
-            color: #ddd;
-        }
-        
-        .loading {
-            text-align: center;
-            color: #00ff88;
-            font-size: 1.2rem;
-            padding: 40px;
-        }
-        
-        .no-results {
-            text-align: center;
-            color: #888;
-            font-size: 1.1rem;
-            padding: 40px;
-        }
-        
-        .hidden {
-            display: none;
-        }
-        
-        .fade-in {
-            animation: fadeIn 0.5s ease-in;
-        }
-        
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateY(20px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-        
-        .welcome-message {
-            text-align: center;
-            margin-bottom: 30px;
-            opacity: 0.7;
-        }
-        
-        .country-suggestions {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 10px;
-            margin-top: 15px;
-            justify-content: center;
-        }
-        
-        .suggestion-tag {
-            background: #333;
-            color: #00ff88;
-            padding: 8px 15px;
-            border-radius: 20px;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            border: 1px solid #555;
-        }
-        
-        .suggestion-tag:hover {
-            background: #00ff88;
-            color: #000;
-            transform: scale(1.05);
-        }
-        
-        .today-news {
-            width: 100%;
-            max-width: 900px;
-            margin-top: 30px;
-        }
-        
-        .news-bullets {
-            display: flex;
-            flex-direction: column;
-            gap: 20px;
-        }
-        
-        .news-bullet-item {
-            background: linear-gradient(135deg, #1a1a1a, #2a2a2a);
-            border: 1px solid #333;
-            border-radius: 15px;
-            padding: 20px;
-            box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3);
-            transition: all 0.3s ease;
-            position: relative;
-        }
-        
-        .news-bullet-item:hover {
-            border-color: #00ff88;
-            transform: translateY(-2px);
-            box-shadow: 0 8px 25px rgba(0, 255, 136, 0.1);
-        }
-        
-        .news-bullet-item::before {
-            content: '•';
-            position: absolute;
-            left: -10px;
-            top: 20px;
-            color: #00ff88;
-            font-size: 2rem;
-            font-weight: bold;
-        }
-        
-        .bullet-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: flex-start;
-            margin-bottom: 15px;
-            gap: 15px;
-        }
-        
-        .bullet-title {
-            color: #00ff88;
-            font-size: 1.1rem;
-            font-weight: bold;
-            flex: 1;
-            line-height: 1.4;
-        }
-        
-        .bullet-date {
-            color: #00ff88;
-            font-weight: bold;
-            background: rgba(0, 255, 136, 0.1);
-            padding: 3px 8px;
-            border-radius: 8px;
-            border: 1px solid #00ff88;
-            font-size: 0.8rem;
-            margin-bottom: 10px;
-            display: inline-block;
-        }
-        
-        .bullet-countries {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 5px;
-            flex-shrink: 0;
-        }
-        
-        .country-tag-small {
-            background: linear-gradient(135deg, #00ff88, #00cc6a);
-            color: #000;
-            padding: 3px 8px;
-            border-radius: 12px;
-            font-size: 0.7rem;
-            font-weight: bold;
-        }
-        
-        .bullet-content {
-            color: #ddd;
-            line-height: 1.6;
-            margin-bottom: 15px;
-            font-size: 0.95rem;
-        }
-        
-        .bullet-link {
-            text-align: right;
-        }
-        
-        .bullet-link a {
-            color: #00ff88;
-            text-decoration: none;
-            font-size: 0.9rem;
-            padding: 5px 10px;
-            border: 1px solid #00ff88;
-            border-radius: 8px;
-            transition: all 0.3s ease;
-        }
-        
-        .bullet-link a:hover {
-            background: #00ff88;
-            color: #000;
-        }
-        
-        .no-news-message {
-            text-align: center;
-            padding: 60px 20px;
-            background: linear-gradient(135deg, #1a1a1a, #2a2a2a);
-            border: 2px solid #333;
-            border-radius: 20px;
-            box-shadow: 0 10px 30px rgba(0, 0, 0, 0.3);
-        }
-        
-        .no-news-icon {
-            font-size: 4rem;
-            margin-bottom: 20px;
-            opacity: 0.7;
-        }
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>Hello F1 Student</h1>
-        <p>Find today's F1 student news from USCIS</p>
-    </div>
-    
-    <div class="chat-bubble fade-in">
-        <h2>Where are you from?</h2>
-        <div class="welcome-message">
-            Select your country to find today's F1 student news and updates
-        </div>
-        
-        <input type="text" id="country-input" class="country-input" placeholder="Type your country name here..." autocomplete="off">
-        
-        <div class="country-suggestions">
-            <span class="suggestion-tag" onclick="selectCountry('China')">China</span>
-            <span class="suggestion-tag" onclick="selectCountry('India')">India</span>
-            <span class="suggestion-tag" onclick="selectCountry('Brazil')">Brazil</span>
-            <span class="suggestion-tag" onclick="selectCountry('Mexico')">Mexico</span>
-            <span class="suggestion-tag" onclick="selectCountry('Nigeria')">Nigeria</span>
-            <span class="suggestion-tag" onclick="selectCountry('Germany')">Germany</span>
-            <span class="suggestion-tag" onclick="selectCountry('Vietnam')">Vietnam</span>
-            <span class="suggestion-tag" onclick="selectCountry('Philippines')">Philippines</span>
-        </div>
-        
-        <div style="display: flex; gap: 10px; margin-top: 20px;">
-            <button class="search-btn" onclick="performSearch()" style="flex: 1;">Search F1 News</button>
-            <button class="search-btn" onclick="showTodayNews()" style="flex: 1; background: linear-gradient(135deg, #666, #888);">Show All Today's News</button>
-        </div>
-    </div>
-    
-    <div id="search-results" class="results hidden"></div>
-    
-    <!-- Today's F1 News Summary -->
-    <div id="today-news-summary" class="today-news">
-        <h2 style="color: #00ff88; margin-bottom: 20px; text-align: center;">Today's F1 Student News Summary</h2>
-        {% if all_today_news %}
-        <div class="news-bullets">
-            {% for article in all_today_news %}
-            <div class="news-bullet-item">
-                <div class="bullet-date">{{ article.date or 'Date not available' }}</div>
-                <div class="bullet-header">
-                    <span class="bullet-title">{{ article.title }}</span>
-                    <span class="bullet-countries">
-                        {% for country in article.countries %}
-                        <span class="country-tag-small">{{ country }}</span>
-                        {% endfor %}
-                    </span>
-                </div>
-                <div class="bullet-content">{{ article.summary }}</div>
-                <div class="bullet-link">
-                    <a href="{{ article.url }}" target="_blank">Read Full Article</a>
-                </div>
-            </div>
-            {% endfor %}
-        </div>
-        {% else %}
-        <div class="no-news-message">
-            <div class="no-news-icon">📰</div>
-            <h3 style="color: #00ff88; margin-bottom: 15px;">No F1 Student News for Today</h3>
-            <p style="color: #aaa; text-align: center; font-size: 1.1rem;">
-                There are no F1 student-related news articles from USCIS today.<br>
-                Check back tomorrow for the latest updates!
-            </p>
-        </div>
-        {% endif %}
-    </div>
-    
-    <script>
-        function selectCountry(country) {
-            document.getElementById('country-input').value = country;
-        }
-        
-        function performSearch() {
-            const country = document.getElementById('country-input').value.trim();
-            const resultsDiv = document.getElementById('search-results');
-            const todayNewsDiv = document.getElementById('today-news-summary');
-            
-            if (!country) {
-                alert('Please enter or select your country');
-                return;
-            }
-            
-            // Hide today's news summary and show search results
-            todayNewsDiv.style.display = 'none';
-            resultsDiv.innerHTML = '<div class="loading">Searching for F1 news from ' + country + '...</div>';
-            resultsDiv.classList.remove('hidden');
-            
-            let url = '/search?country=' + encodeURIComponent(country);
-            
-            fetch(url)
-                .then(response => response.json())
-                .then(data => {
-                    displayResults(data.results, country);
-                })
-                .catch(error => {
-                    resultsDiv.innerHTML = '<div class="no-results">Error searching: ' + error + '</div>';
-                });
-        }
-        
-        function showTodayNews() {
-            const resultsDiv = document.getElementById('search-results');
-            const todayNewsDiv = document.getElementById('today-news-summary');
-            
-            // Hide search results and show today's news
-            resultsDiv.classList.add('hidden');
-            todayNewsDiv.style.display = 'block';
-            
-            // Clear the search input
-            document.getElementById('country-input').value = '';
-        }
-        
-        function displayResults(results, country) {
-            const resultsDiv = document.getElementById('search-results');
-            
-            if (results.length === 0) {
-                resultsDiv.innerHTML = '<div class="no-results">No F1 news found for ' + country + ' today.</div>';
-                return;
-            }
-            
-            let html = '<h2 style="color: #00ff88; margin-bottom: 20px; text-align: center;">F1 News for ' + country + ' (' + results.length + ' articles)</h2>';
-            
-            results.forEach((article, index) => {
-                html += '<div class="result-item fade-in" style="animation-delay: ' + (index * 0.1) + 's">';
-                html += '<div class="result-title">' + article.title + '</div>';
-                html += '<div class="result-meta">';
-                html += '<span class="result-date">' + (article.date || 'Date not available') + '</span>';
-                html += '<a href="' + article.url + '" target="_blank">Read Full Article</a>';
-                html += '</div>';
-                
-                if (article.countries && article.countries.length > 0) {
-                    html += '<div class="countries-list">';
-                    article.countries.forEach(country => {
-                        html += '<span class="country-tag">' + country + '</span>';
-                    });
-                    html += '</div>';
-                }
-                
-                html += '<div class="result-summary">' + (article.summary || 'No summary available') + '</div>';
-                html += '</div>';
-            });
-            
-            resultsDiv.innerHTML = html;
-        }
-        
-        // Allow Enter key to trigger search
-        document.getElementById('country-input').addEventListener('keypress', function(e) {
-            if (e.key === 'Enter') {
-                performSearch();
-            }
-        });
-        
-        // Auto-focus on the input field
-        document.getElementById('country-input').focus();
-    </script>
-</body>
-</html>
-        '''
-        
-        with open('templates/index.html', 'w', encoding='utf-8') as f:
-            f.write(html_template)
-        
+    if args.serve:
+        serve_production(searcher, args.bind, args.workers, args.threads, args.response_cache_mb * 1024 * 1024,
+                         args.watch_interval if args.watch else None, update_archive if follow_latest else None)
+    
+    elif args.web:
         print("Starting web interface...")
         print("Open your browser to: http://localhost:5003")
         webbrowser.open('http://localhost:5003')
-        app = create_web_interface(searcher)
+        if args.watch:
+            # Without --data, fold new snapshot files into the archive as they appear
+            searcher.start_watching(args.watch_interval, update_archive if follow_latest else None)
+        app = create_web_interface(searcher, args.response_cache_mb * 1024 * 1024)
         app.run(debug=True, port=5003)
     
     elif args.list_countries:
@@ -724,17 +957,18 @@ def main():
         for country in countries:
             print(f"  - {country}")
     
+    elif args.recent or args.since or args.until:
+        total, results = searcher.get_news_in_range(args.since, args.until, args.recent,
+                                                    args.country, args.keyword, args.limit, args.offset)
+        searcher.display_results(results, args.limit, total, args.offset)
+    
     elif args.country:
         results = searcher.search_by_country(args.country)
         searcher.display_results(results)
     
     elif args.keyword:
-        results = searcher.search_by_keyword(args.keyword)
-        searcher.display_results(results)
-    
-    elif args.recent:
-        results = searcher.get_recent_news(args.recent)
-        searcher.display_results(results)
+        total, results = searcher.rank_by_keyword(args.keyword, args.limit, args.offset)
+        searcher.display_results(results, args.limit, total, args.offset)
     
     else:
         print("Use --help to see available options")